@@ -123,6 +123,7 @@ def extract_team_prices(
       }
     """
     games: List[Dict[str, Any]] = []
+    wanted_books = frozenset(bookmaker_keys)
 
     for event in events:
         home = event.get("home_team")
@@ -137,7 +138,7 @@ def extract_team_prices(
 
         for bookmaker in event.get("bookmakers", []):
             book_key = bookmaker.get("key")
-            if book_key not in bookmaker_keys:
+            if book_key not in wanted_books:
                 continue
 
             market = next(
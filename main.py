@@ -1,20 +1,29 @@
+import heapq
 import json
 import logging
+import math
 import os
 import random
 import re
 import sys
 import unicodedata
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from typing import ClassVar, List, Dict, Any, Set, Optional, Sequence
+from typing import Callable, ClassVar, List, Dict, Any, NamedTuple, Set, Optional, Sequence, Tuple
 
 import requests
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field, model_validator
 
+try:  # pragma: no cover - optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover - fallback to the stdlib encoder
+    orjson = None
+
 # Import shared utilities
 from services.api_gateway import ApiGateway
 from services.odds_api import (
@@ -23,14 +32,16 @@ from services.odds_api import (
     fetch_player_props,
     fetch_sport_events,
 )
-from services.results_store import ResultsStore
+from services.odds_cache import clear_odds_cache
+from services.results_store import LiveResultCache, ResultsStore
 from services.scheduler import SnapshotScheduler
 from services.domain import mappers as domain_mappers
 from services.odds_service import OddsService
 from services.odds_utils import (
     american_to_decimal,
-    estimate_ev_percent,
-    points_match,
+    estimate_ev_percent_from_decimal,
+    points_match_exact,
+    points_matcher,
     apply_vig_adjustment,
     decimal_to_american,
     sanitize_american_price,
@@ -54,7 +65,7 @@ from services.snapshot_config import (
     DEFAULT_SNAPSHOT_SPORTS,
     SNAPSHOT_INTERVAL_SECONDS,
 )
-from utils.formatting import format_start_time_est
+from utils.formatting import format_datetime_est, format_start_time_est, parse_iso_datetime
 from utils.logging_control import apply_trace_level, should_log_trace_entries
 
 # Use the uvicorn logger so messages show alongside existing INFO entries.
@@ -453,6 +464,126 @@ def get_textbelt_api_key() -> Optional[str]:
     return os.getenv("TEXTBELT_API_KEY")
 
 
+# Timestamp layout used by The Odds API ("2024-01-01T00:00:00Z"); dummy payloads
+# format their times the same way.
+ODDS_API_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+# Sample games for dummy odds, priced like real Odds API captures.
+_DUMMY_ODDS_SAMPLE_EVENTS = {
+    "basketball_nba": [
+        {
+            "home_team": "Washington Wizards",
+            "away_team": "Milwaukee Bucks",
+            "commence_in_hours": 6,
+            "bookmakers": {
+                "novig": {
+                    "h2h": {"home": -145, "away": +130},
+                    "spreads": {"point": -4.5, "home_price": -112, "away_price": -102},
+                    "totals": {"point": 231.5, "over_price": -112, "under_price": -108},
+                },
+                "fliff": {
+                    "h2h": {"home": -135, "away": +145},
+                    "spreads": {"point": -4.5, "home_price": -105, "away_price": -115},
+                    "totals": {"point": 231.5, "over_price": -105, "under_price": -110},
+                },
+                "draftkings": {
+                    "h2h": {"home": -140, "away": +135},
+                    "spreads": {"point": -4.5, "home_price": -108, "away_price": -112},
+                    "totals": {"point": 231.5, "over_price": -110, "under_price": -110},
+                },
+            },
+        },
+        {
+            "home_team": "Denver Nuggets",
+            "away_team": "Phoenix Suns",
+            "commence_in_hours": 30,
+            "bookmakers": {
+                "novig": {
+                    "h2h": {"home": -125, "away": +118},
+                    "spreads": {"point": -3.5, "home_price": -110, "away_price": -104},
+                    "totals": {"point": 227.5, "over_price": -115, "under_price": -105},
+                },
+                "fliff": {
+                    "h2h": {"home": -120, "away": +125},
+                    "spreads": {"point": -3.5, "home_price": -102, "away_price": -110},
+                    "totals": {"point": 227.5, "over_price": -108, "under_price": -104},
+                },
+                "draftkings": {
+                    "h2h": {"home": -122, "away": +122},
+                    "spreads": {"point": -3.5, "home_price": -106, "away_price": -108},
+                    "totals": {"point": 227.5, "over_price": -112, "under_price": -108},
+                },
+            },
+        },
+    ],
+    "americanfootball_nfl": [
+        {
+            "home_team": "San Francisco 49ers",
+            "away_team": "Dallas Cowboys",
+            "commence_in_hours": 54,
+            "bookmakers": {
+                "novig": {
+                    "h2h": {"home": -175, "away": +155},
+                    "spreads": {"point": -3.5, "home_price": -112, "away_price": -102},
+                    "totals": {"point": 44.5, "over_price": -110, "under_price": -108},
+                },
+                "fliff": {
+                    "h2h": {"home": -165, "away": +165},
+                    "spreads": {"point": -3.5, "home_price": -104, "away_price": -112},
+                    "totals": {"point": 44.5, "over_price": -106, "under_price": -104},
+                },
+                "draftkings": {
+                    "h2h": {"home": -170, "away": +160},
+                    "spreads": {"point": -3.5, "home_price": -108, "away_price": -110},
+                    "totals": {"point": 44.5, "over_price": -108, "under_price": -110},
+                },
+            },
+        },
+        {
+            "home_team": "Buffalo Bills",
+            "away_team": "Kansas City Chiefs",
+            "commence_in_hours": 74,
+            "bookmakers": {
+                "novig": {
+                    "h2h": {"home": -115, "away": +108},
+                    "spreads": {"point": -2.5, "home_price": -110, "away_price": -104},
+                    "totals": {"point": 48.5, "over_price": -112, "under_price": -102},
+                },
+                "fliff": {
+                    "h2h": {"home": -110, "away": +118},
+                    "spreads": {"point": -2.5, "home_price": -102, "away_price": -110},
+                    "totals": {"point": 48.5, "over_price": -106, "under_price": -104},
+                },
+                "draftkings": {
+                    "h2h": {"home": -112, "away": +114},
+                    "spreads": {"point": -2.5, "home_price": -104, "away_price": -112},
+                    "totals": {"point": 48.5, "over_price": -108, "under_price": -106},
+                },
+            },
+        },
+    ],
+}
+# Generic game for sports without sample data so callers never break.
+_DUMMY_ODDS_FALLBACK_EVENTS = [
+    {
+        "home_team": "Home Team",
+        "away_team": "Away Team",
+        "commence_in_hours": 24,
+        "bookmakers": {
+            "novig": {
+                "h2h": {"home": -120, "away": +110},
+                "spreads": {"point": -3.0, "home_price": -110, "away_price": -104},
+                "totals": {"point": 46.5, "over_price": -112, "under_price": -108},
+            },
+            "fliff": {
+                "h2h": {"home": -115, "away": +120},
+                "spreads": {"point": -3.0, "home_price": -104, "away_price": -110},
+                "totals": {"point": 46.5, "over_price": -106, "under_price": -104},
+            },
+        },
+    }
+]
 
 
 def generate_dummy_odds_data(
@@ -468,103 +599,9 @@ def generate_dummy_odds_data(
     numbers realistic while ensuring every market type (moneyline, spreads,
     totals) has a few clear value spots when compared to Novig.
     """
-    sample_events = {
-        "basketball_nba": [
-            {
-                "home_team": "Washington Wizards",
-                "away_team": "Milwaukee Bucks",
-                "commence_in_hours": 6,
-                "bookmakers": {
-                    "novig": {
-                        "h2h": {"home": -145, "away": +130},
-                        "spreads": {"point": -4.5, "home_price": -112, "away_price": -102},
-                        "totals": {"point": 231.5, "over_price": -112, "under_price": -108},
-                    },
-                    "fliff": {
-                        "h2h": {"home": -135, "away": +145},
-                        "spreads": {"point": -4.5, "home_price": -105, "away_price": -115},
-                        "totals": {"point": 231.5, "over_price": -105, "under_price": -110},
-                    },
-                    "draftkings": {
-                        "h2h": {"home": -140, "away": +135},
-                        "spreads": {"point": -4.5, "home_price": -108, "away_price": -112},
-                        "totals": {"point": 231.5, "over_price": -110, "under_price": -110},
-                    },
-                },
-            },
-            {
-                "home_team": "Denver Nuggets",
-                "away_team": "Phoenix Suns",
-                "commence_in_hours": 30,
-                "bookmakers": {
-                    "novig": {
-                        "h2h": {"home": -125, "away": +118},
-                        "spreads": {"point": -3.5, "home_price": -110, "away_price": -104},
-                        "totals": {"point": 227.5, "over_price": -115, "under_price": -105},
-                    },
-                    "fliff": {
-                        "h2h": {"home": -120, "away": +125},
-                        "spreads": {"point": -3.5, "home_price": -102, "away_price": -110},
-                        "totals": {"point": 227.5, "over_price": -108, "under_price": -104},
-                    },
-                    "draftkings": {
-                        "h2h": {"home": -122, "away": +122},
-                        "spreads": {"point": -3.5, "home_price": -106, "away_price": -108},
-                        "totals": {"point": 227.5, "over_price": -112, "under_price": -108},
-                    },
-                },
-            },
-        ],
-        "americanfootball_nfl": [
-            {
-                "home_team": "San Francisco 49ers",
-                "away_team": "Dallas Cowboys",
-                "commence_in_hours": 54,
-                "bookmakers": {
-                    "novig": {
-                        "h2h": {"home": -175, "away": +155},
-                        "spreads": {"point": -3.5, "home_price": -112, "away_price": -102},
-                        "totals": {"point": 44.5, "over_price": -110, "under_price": -108},
-                    },
-                    "fliff": {
-                        "h2h": {"home": -165, "away": +165},
-                        "spreads": {"point": -3.5, "home_price": -104, "away_price": -112},
-                        "totals": {"point": 44.5, "over_price": -106, "under_price": -104},
-                    },
-                    "draftkings": {
-                        "h2h": {"home": -170, "away": +160},
-                        "spreads": {"point": -3.5, "home_price": -108, "away_price": -110},
-                        "totals": {"point": 44.5, "over_price": -108, "under_price": -110},
-                    },
-                },
-            },
-            {
-                "home_team": "Buffalo Bills",
-                "away_team": "Kansas City Chiefs",
-                "commence_in_hours": 74,
-                "bookmakers": {
-                    "novig": {
-                        "h2h": {"home": -115, "away": +108},
-                        "spreads": {"point": -2.5, "home_price": -110, "away_price": -104},
-                        "totals": {"point": 48.5, "over_price": -112, "under_price": -102},
-                    },
-                    "fliff": {
-                        "h2h": {"home": -110, "away": +118},
-                        "spreads": {"point": -2.5, "home_price": -102, "away_price": -110},
-                        "totals": {"point": 48.5, "over_price": -106, "under_price": -104},
-                    },
-                    "draftkings": {
-                        "h2h": {"home": -112, "away": +114},
-                        "spreads": {"point": -2.5, "home_price": -104, "away_price": -112},
-                        "totals": {"point": 48.5, "over_price": -108, "under_price": -106},
-                    },
-                },
-            },
-        ],
-    }
-
     requested_markets = markets.split(",") if "," in markets else [markets]
     now = datetime.now(timezone.utc)
+    now_ts = int(now.timestamp())
     events: List[Dict[str, Any]] = []
 
     def build_market_payload(market_key: str, market_values: Dict[str, Any], home: str, away: str) -> Dict[str, Any]:
@@ -596,35 +633,17 @@ def generate_dummy_odds_data(
             }
         return {}
 
-    sport_events = sample_events.get(sport_key)
+    sport_events = _DUMMY_ODDS_SAMPLE_EVENTS.get(sport_key)
     if not sport_events:
         # Fallback: generate a single simple event with generic teams so callers never break
-        sport_events = [
-            {
-                "home_team": "Home Team",
-                "away_team": "Away Team",
-                "commence_in_hours": 24,
-                "bookmakers": {
-                    "novig": {
-                        "h2h": {"home": -120, "away": +110},
-                        "spreads": {"point": -3.0, "home_price": -110, "away_price": -104},
-                        "totals": {"point": 46.5, "over_price": -112, "under_price": -108},
-                    },
-                    "fliff": {
-                        "h2h": {"home": -115, "away": +120},
-                        "spreads": {"point": -3.0, "home_price": -104, "away_price": -110},
-                        "totals": {"point": 46.5, "over_price": -106, "under_price": -104},
-                    },
-                },
-            }
-        ]
+        sport_events = _DUMMY_ODDS_FALLBACK_EVENTS
 
     for idx, event in enumerate(sport_events):
         home = event["home_team"]
         away = event["away_team"]
         commence_time = (
             now + timedelta(hours=event.get("commence_in_hours", 24))
-        ).isoformat().replace("+00:00", "Z")
+        ).strftime(ODDS_API_TIMESTAMP_FORMAT)
 
         bookmakers: List[Dict[str, Any]] = []
         for book_key in bookmaker_keys:
@@ -651,7 +670,7 @@ def generate_dummy_odds_data(
             continue
 
         events.append({
-            "id": f"dummy_{sport_key}_{idx}_{int(now.timestamp())}",
+            "id": f"dummy_{sport_key}_{idx}_{now_ts}",
             "sport_key": sport_key,
             "home_team": home,
             "away_team": away,
@@ -661,6 +680,201 @@ def generate_dummy_odds_data(
 
     return events
 
+
+# Dummy prop markets priced as Yes/No rather than Over/Under a line.
+_DUMMY_YES_NO_PROP_MARKETS = {
+    "player_1st_td",
+    "player_anytime_td",
+    "player_last_td",
+    "player_first_basket",
+    "player_first_team_basket",
+    "player_double_double",
+    "player_triple_double",
+    "batter_first_home_run",
+    "pitcher_record_a_win",
+    "player_goal_scorer_first",
+    "player_goal_scorer_last",
+    "player_goal_scorer_anytime",
+    "player_first_goal_scorer",
+    "player_last_goal_scorer",
+    "player_try_scorer_first",
+    "player_try_scorer_last",
+    "player_try_scorer_anytime",
+    "player_marks_most",
+    "player_tackles_most",
+    "player_afl_fantasy_points_most",
+    "player_to_receive_card",
+    "player_to_receive_red_card",
+}
+
+# Sample players by sport and team for dummy player props.
+_DUMMY_NBA_PLAYERS = {
+    "Lakers": ["LeBron James", "Anthony Davis", "D'Angelo Russell", "Austin Reaves"],
+    "Warriors": ["Stephen Curry", "Klay Thompson", "Draymond Green", "Andrew Wiggins"],
+    "Celtics": ["Jayson Tatum", "Jaylen Brown", "Kristaps Porzingis", "Derrick White"],
+    "Heat": ["Jimmy Butler", "Bam Adebayo", "Tyler Herro", "Duncan Robinson"],
+    "Nuggets": ["Nikola Jokic", "Jamal Murray", "Michael Porter Jr.", "Aaron Gordon"],
+    "Suns": ["Devin Booker", "Kevin Durant", "Bradley Beal", "Jusuf Nurkic"],
+    "Bucks": ["Giannis Antetokounmpo", "Damian Lillard", "Khris Middleton", "Brook Lopez"],
+    "76ers": ["Joel Embiid", "Tyrese Maxey", "Tobias Harris", "James Harden"],
+    "Mavericks": ["Luka Doncic", "Kyrie Irving", "Tim Hardaway Jr.", "Grant Williams"],
+    "Clippers": ["Kawhi Leonard", "Paul George", "James Harden", "Russell Westbrook"],
+}
+
+_DUMMY_NFL_PLAYERS = {
+    "Chiefs": ["Patrick Mahomes", "Travis Kelce", "Isiah Pacheco", "Rashee Rice"],
+    "Bills": ["Josh Allen", "Stefon Diggs", "James Cook", "Dawson Knox"],
+    "49ers": ["Brock Purdy", "Christian McCaffrey", "Deebo Samuel", "George Kittle"],
+    "Cowboys": ["Dak Prescott", "CeeDee Lamb", "Tony Pollard", "Jake Ferguson"],
+    "Ravens": ["Lamar Jackson", "Mark Andrews", "Gus Edwards", "Zay Flowers"],
+    "Bengals": ["Joe Burrow", "Ja'Marr Chase", "Joe Mixon", "Tee Higgins"],
+    "Dolphins": ["Tua Tagovailoa", "Tyreek Hill", "Raheem Mostert", "Jaylen Waddle"],
+    "Jets": ["Aaron Rodgers", "Breece Hall", "Garrett Wilson", "Tyler Conklin"],
+    "Eagles": ["Jalen Hurts", "A.J. Brown", "D'Andre Swift", "DeVonta Smith"],
+    "Giants": ["Daniel Jones", "Saquon Barkley", "Darius Slayton", "Darren Waller"],
+}
+
+_DUMMY_NHL_PLAYERS = {
+    "Rangers": ["Artemi Panarin", "Mika Zibanejad", "Chris Kreider", "Adam Fox"],
+    "Bruins": ["David Pastrnak", "Brad Marchand", "Charlie McAvoy", "Hampus Lindholm"],
+    "Maple Leafs": ["Auston Matthews", "Mitch Marner", "William Nylander", "John Tavares"],
+    "Avalanche": ["Nathan MacKinnon", "Mikko Rantanen", "Cale Makar", "Alexandar Georgiev"],
+    "Golden Knights": ["Jack Eichel", "Mark Stone", "Jonathan Marchessault", "Shea Theodore"],
+}
+
+_DUMMY_MLB_PLAYERS = {
+    "Dodgers": ["Mookie Betts", "Freddie Freeman", "Shohei Ohtani", "Will Smith"],
+    "Yankees": ["Aaron Judge", "Juan Soto", "Anthony Rizzo", "Gleyber Torres"],
+    "Braves": ["Ronald Acuna Jr.", "Matt Olson", "Austin Riley", "Ozzie Albies"],
+}
+
+_DUMMY_SOCCER_PLAYERS = {
+    "Manchester City": ["Erling Haaland", "Kevin De Bruyne", "Phil Foden", "Rodri"],
+    "Real Madrid": ["Vinicius Jr", "Jude Bellingham", "Rodrygo", "Federico Valverde"],
+    "Liverpool": ["Mohamed Salah", "Luis Diaz", "Darwin Nunez", "Alexis Mac Allister"],
+}
+
+_DUMMY_AFL_PLAYERS = {
+    "Collingwood": ["Nick Daicos", "Scott Pendlebury", "Jordan De Goey", "Brody Mihocek"],
+    "Brisbane": ["Lachie Neale", "Charlie Cameron", "Joe Daniher", "Josh Dunkley"],
+}
+
+_DUMMY_NRL_PLAYERS = {
+    "Panthers": ["Nathan Cleary", "Jarome Luai", "Brian To'o", "Isaah Yeo"],
+    "Broncos": ["Adam Reynolds", "Reece Walsh", "Payne Haas", "Kotoni Staggs"],
+}
+
+_DUMMY_PLAYERS_BY_SPORT = {
+    "basketball_nba": _DUMMY_NBA_PLAYERS,
+    "basketball_ncaab": _DUMMY_NBA_PLAYERS,
+    "basketball_wnba": _DUMMY_NBA_PLAYERS,
+    "americanfootball_nfl": _DUMMY_NFL_PLAYERS,
+    "americanfootball_ncaaf": _DUMMY_NFL_PLAYERS,
+    "americanfootball_cfl": _DUMMY_NFL_PLAYERS,
+    "icehockey_nhl": _DUMMY_NHL_PLAYERS,
+    "baseball_mlb": _DUMMY_MLB_PLAYERS,
+    "soccer": _DUMMY_SOCCER_PLAYERS,
+    "aussierules_afl": _DUMMY_AFL_PLAYERS,
+    "rugbyleague_nrl": _DUMMY_NRL_PLAYERS,
+}
+
+# Market-specific point ranges for dummy player props (NBA scale).
+_DUMMY_PROP_POINT_RANGES = {
+    # Basketball
+    "player_points": (20.5, 35.5),
+    "player_points_q1": (5.5, 12.5),
+    "player_rebounds": (6.5, 15.5),
+    "player_rebounds_q1": (1.5, 4.5),
+    "player_assists": (5.5, 12.5),
+    "player_assists_q1": (1.5, 4.5),
+    "player_threes": (2.5, 6.5),
+    "player_blocks": (0.5, 3.5),
+    "player_steals": (0.5, 3.0),
+    "player_blocks_steals": (1.5, 5.5),
+    "player_turnovers": (1.5, 5.5),
+    "player_points_rebounds_assists": (25.5, 55.5),
+    "player_points_rebounds": (25.5, 45.5),
+    "player_points_assists": (23.5, 40.5),
+    "player_rebounds_assists": (10.5, 25.5),
+    "player_field_goals": (7.5, 15.5),
+    "player_frees_made": (3.5, 10.5),
+    "player_frees_attempts": (5.5, 12.5),
+    # NFL / Football
+    "player_defensive_interceptions": (0.5, 1.5),
+    "player_kicking_points": (4.5, 10.5),
+    "player_pass_attempts": (25.5, 45.5),
+    "player_pass_completions": (18.5, 35.5),
+    "player_pass_interceptions": (0.5, 2.5),
+    "player_pass_longest_completion": (20.5, 50.5),
+    "player_pass_rush_yds": (200.5, 420.5),
+    "player_pass_rush_reception_tds": (1.5, 4.5),
+    "player_pass_rush_reception_yds": (150.5, 400.5),
+    "player_pass_tds": (1.5, 3.5),
+    "player_pass_yds": (200.5, 350.5),
+    "player_pass_yds_q1": (40.5, 120.5),
+    "player_pats": (1.5, 3.5),
+    "player_receptions": (3.5, 10.5),
+    "player_reception_longest": (15.5, 35.5),
+    "player_reception_tds": (0.5, 2.5),
+    "player_reception_yds": (50.5, 120.5),
+    "player_rush_attempts": (10.5, 25.5),
+    "player_rush_longest": (10.5, 35.5),
+    "player_rush_reception_tds": (1.5, 3.5),
+    "player_rush_reception_yds": (60.5, 180.5),
+    "player_rush_tds": (0.5, 2.5),
+    "player_rush_yds": (50.5, 120.5),
+    "player_sacks": (1.5, 4.5),
+    "player_solo_tackles": (3.5, 9.5),
+    "player_tackles_assists": (5.5, 12.5),
+    "player_tds_over": (0.5, 3.5),
+    # MLB
+    "batter_home_runs": (0.5, 1.5),
+    "batter_hits": (0.5, 3.5),
+    "batter_total_bases": (1.5, 4.5),
+    "batter_rbis": (0.5, 3.5),
+    "batter_runs_scored": (0.5, 2.5),
+    "batter_hits_runs_rbis": (1.5, 5.5),
+    "batter_singles": (0.5, 2.5),
+    "batter_doubles": (0.5, 1.5),
+    "batter_triples": (0.5, 1.5),
+    "batter_walks": (0.5, 2.5),
+    "batter_strikeouts": (0.5, 2.5),
+    "batter_stolen_bases": (0.5, 2.5),
+    "pitcher_strikeouts": (3.5, 10.5),
+    "pitcher_hits_allowed": (2.5, 7.5),
+    "pitcher_walks": (0.5, 3.5),
+    "pitcher_earned_runs": (0.5, 5.5),
+    "pitcher_outs": (15.5, 21.5),
+    # NHL
+    "player_power_play_points": (0.25, 1.5),
+    "player_blocked_shots": (1.5, 4.5),
+    "player_shots_on_goal": (2.0, 5.5),
+    "player_goals": (0.5, 2.5),
+    "player_total_saves": (24.5, 34.5),
+    # AFL
+    "player_disposals": (15.5, 35.5),
+    "player_disposals_over": (18.5, 32.5),
+    "player_goals_scored_over": (1.5, 4.5),
+    "player_marks_over": (3.5, 12.5),
+    "player_tackles_over": (3.5, 9.5),
+    "player_afl_fantasy_points": (60.5, 120.5),
+    "player_afl_fantasy_points_over": (70.5, 130.5),
+    "player_afl_fantasy_points_most": (70.5, 130.5),
+    # Rugby League
+    "player_try_scorer_over": (0.5, 2.5),
+    # Soccer
+    "player_shots_on_target": (0.5, 3.5),
+    "player_shots": (1.5, 5.5),
+}
+# Outside the NBA, points and assists props are priced on much smaller lines.
+_DUMMY_NON_NBA_PROP_POINT_RANGES = {
+    **_DUMMY_PROP_POINT_RANGES,
+    "player_points": (0.5, 3.5),
+    "player_assists": (0.5, 2.5),
+}
+_DUMMY_PROP_DEFAULT_RANGE = (20.5, 35.5)
+
+
 def generate_dummy_player_props_data(
     sport_key: str,
     markets: List[str],
@@ -675,103 +889,7 @@ def generate_dummy_player_props_data(
     def _slugify(value: str) -> str:
         return value.replace(" ", "_").lower()
 
-    yes_no_markets = {
-        "player_1st_td",
-        "player_anytime_td",
-        "player_last_td",
-        "player_first_basket",
-        "player_first_team_basket",
-        "player_double_double",
-        "player_triple_double",
-        "batter_first_home_run",
-        "pitcher_record_a_win",
-        "player_goal_scorer_first",
-        "player_goal_scorer_last",
-        "player_goal_scorer_anytime",
-        "player_first_goal_scorer",
-        "player_last_goal_scorer",
-        "player_try_scorer_first",
-        "player_try_scorer_last",
-        "player_try_scorer_anytime",
-        "player_marks_most",
-        "player_tackles_most",
-        "player_afl_fantasy_points_most",
-        "player_to_receive_card",
-        "player_to_receive_red_card",
-    }
-
-    # Sample players by sport and team
-    nba_players = {
-        "Lakers": ["LeBron James", "Anthony Davis", "D'Angelo Russell", "Austin Reaves"],
-        "Warriors": ["Stephen Curry", "Klay Thompson", "Draymond Green", "Andrew Wiggins"],
-        "Celtics": ["Jayson Tatum", "Jaylen Brown", "Kristaps Porzingis", "Derrick White"],
-        "Heat": ["Jimmy Butler", "Bam Adebayo", "Tyler Herro", "Duncan Robinson"],
-        "Nuggets": ["Nikola Jokic", "Jamal Murray", "Michael Porter Jr.", "Aaron Gordon"],
-        "Suns": ["Devin Booker", "Kevin Durant", "Bradley Beal", "Jusuf Nurkic"],
-        "Bucks": ["Giannis Antetokounmpo", "Damian Lillard", "Khris Middleton", "Brook Lopez"],
-        "76ers": ["Joel Embiid", "Tyrese Maxey", "Tobias Harris", "James Harden"],
-        "Mavericks": ["Luka Doncic", "Kyrie Irving", "Tim Hardaway Jr.", "Grant Williams"],
-        "Clippers": ["Kawhi Leonard", "Paul George", "James Harden", "Russell Westbrook"],
-    }
-
-    nfl_players = {
-        "Chiefs": ["Patrick Mahomes", "Travis Kelce", "Isiah Pacheco", "Rashee Rice"],
-        "Bills": ["Josh Allen", "Stefon Diggs", "James Cook", "Dawson Knox"],
-        "49ers": ["Brock Purdy", "Christian McCaffrey", "Deebo Samuel", "George Kittle"],
-        "Cowboys": ["Dak Prescott", "CeeDee Lamb", "Tony Pollard", "Jake Ferguson"],
-        "Ravens": ["Lamar Jackson", "Mark Andrews", "Gus Edwards", "Zay Flowers"],
-        "Bengals": ["Joe Burrow", "Ja'Marr Chase", "Joe Mixon", "Tee Higgins"],
-        "Dolphins": ["Tua Tagovailoa", "Tyreek Hill", "Raheem Mostert", "Jaylen Waddle"],
-        "Jets": ["Aaron Rodgers", "Breece Hall", "Garrett Wilson", "Tyler Conklin"],
-        "Eagles": ["Jalen Hurts", "A.J. Brown", "D'Andre Swift", "DeVonta Smith"],
-        "Giants": ["Daniel Jones", "Saquon Barkley", "Darius Slayton", "Darren Waller"],
-    }
-
-    nhl_players = {
-        "Rangers": ["Artemi Panarin", "Mika Zibanejad", "Chris Kreider", "Adam Fox"],
-        "Bruins": ["David Pastrnak", "Brad Marchand", "Charlie McAvoy", "Hampus Lindholm"],
-        "Maple Leafs": ["Auston Matthews", "Mitch Marner", "William Nylander", "John Tavares"],
-        "Avalanche": ["Nathan MacKinnon", "Mikko Rantanen", "Cale Makar", "Alexandar Georgiev"],
-        "Golden Knights": ["Jack Eichel", "Mark Stone", "Jonathan Marchessault", "Shea Theodore"],
-    }
-
-    mlb_players = {
-        "Dodgers": ["Mookie Betts", "Freddie Freeman", "Shohei Ohtani", "Will Smith"],
-        "Yankees": ["Aaron Judge", "Juan Soto", "Anthony Rizzo", "Gleyber Torres"],
-        "Braves": ["Ronald Acuna Jr.", "Matt Olson", "Austin Riley", "Ozzie Albies"],
-    }
-
-    soccer_players = {
-        "Manchester City": ["Erling Haaland", "Kevin De Bruyne", "Phil Foden", "Rodri"],
-        "Real Madrid": ["Vinicius Jr", "Jude Bellingham", "Rodrygo", "Federico Valverde"],
-        "Liverpool": ["Mohamed Salah", "Luis Diaz", "Darwin Nunez", "Alexis Mac Allister"],
-    }
-
-    afl_players = {
-        "Collingwood": ["Nick Daicos", "Scott Pendlebury", "Jordan De Goey", "Brody Mihocek"],
-        "Brisbane": ["Lachie Neale", "Charlie Cameron", "Joe Daniher", "Josh Dunkley"],
-    }
-
-    nrl_players = {
-        "Panthers": ["Nathan Cleary", "Jarome Luai", "Brian To'o", "Isaah Yeo"],
-        "Broncos": ["Adam Reynolds", "Reece Walsh", "Payne Haas", "Kotoni Staggs"],
-    }
-
-    players_by_sport = {
-        "basketball_nba": nba_players,
-        "basketball_ncaab": nba_players,
-        "basketball_wnba": nba_players,
-        "americanfootball_nfl": nfl_players,
-        "americanfootball_ncaaf": nfl_players,
-        "americanfootball_cfl": nfl_players,
-        "icehockey_nhl": nhl_players,
-        "baseball_mlb": mlb_players,
-        "soccer": soccer_players,
-        "aussierules_afl": afl_players,
-        "rugbyleague_nrl": nrl_players,
-    }
-
-    player_map = players_by_sport.get(sport_key, nba_players)
+    player_map = _DUMMY_PLAYERS_BY_SPORT.get(sport_key, _DUMMY_NBA_PLAYERS)
 
     # Determine which teams and players to use
     if team and team in player_map:
@@ -779,107 +897,24 @@ def generate_dummy_player_props_data(
     else:
         teams_to_use = list(player_map.keys())[:3]  # Use first 3 teams
 
-    # Market-specific point ranges
     selected_markets = markets or ["player_points"]
-
-    point_ranges = {
-        # Basketball
-        "player_points": (20.5, 35.5) if sport_key == "basketball_nba" else (0.5, 3.5),
-        "player_points_q1": (5.5, 12.5),
-        "player_rebounds": (6.5, 15.5),
-        "player_rebounds_q1": (1.5, 4.5),
-        "player_assists": (5.5, 12.5) if sport_key == "basketball_nba" else (0.5, 2.5),
-        "player_assists_q1": (1.5, 4.5),
-        "player_threes": (2.5, 6.5),
-        "player_blocks": (0.5, 3.5),
-        "player_steals": (0.5, 3.0),
-        "player_blocks_steals": (1.5, 5.5),
-        "player_turnovers": (1.5, 5.5),
-        "player_points_rebounds_assists": (25.5, 55.5),
-        "player_points_rebounds": (25.5, 45.5),
-        "player_points_assists": (23.5, 40.5),
-        "player_rebounds_assists": (10.5, 25.5),
-        "player_field_goals": (7.5, 15.5),
-        "player_frees_made": (3.5, 10.5),
-        "player_frees_attempts": (5.5, 12.5),
-        # NFL / Football
-        "player_defensive_interceptions": (0.5, 1.5),
-        "player_kicking_points": (4.5, 10.5),
-        "player_pass_attempts": (25.5, 45.5),
-        "player_pass_completions": (18.5, 35.5),
-        "player_pass_interceptions": (0.5, 2.5),
-        "player_pass_longest_completion": (20.5, 50.5),
-        "player_pass_rush_yds": (200.5, 420.5),
-        "player_pass_rush_reception_tds": (1.5, 4.5),
-        "player_pass_rush_reception_yds": (150.5, 400.5),
-        "player_pass_tds": (1.5, 3.5),
-        "player_pass_yds": (200.5, 350.5),
-        "player_pass_yds_q1": (40.5, 120.5),
-        "player_pats": (1.5, 3.5),
-        "player_receptions": (3.5, 10.5),
-        "player_reception_longest": (15.5, 35.5),
-        "player_reception_tds": (0.5, 2.5),
-        "player_reception_yds": (50.5, 120.5),
-        "player_rush_attempts": (10.5, 25.5),
-        "player_rush_longest": (10.5, 35.5),
-        "player_rush_reception_tds": (1.5, 3.5),
-        "player_rush_reception_yds": (60.5, 180.5),
-        "player_rush_tds": (0.5, 2.5),
-        "player_rush_yds": (50.5, 120.5),
-        "player_sacks": (1.5, 4.5),
-        "player_solo_tackles": (3.5, 9.5),
-        "player_tackles_assists": (5.5, 12.5),
-        "player_tds_over": (0.5, 3.5),
-        # MLB
-        "batter_home_runs": (0.5, 1.5),
-        "batter_hits": (0.5, 3.5),
-        "batter_total_bases": (1.5, 4.5),
-        "batter_rbis": (0.5, 3.5),
-        "batter_runs_scored": (0.5, 2.5),
-        "batter_hits_runs_rbis": (1.5, 5.5),
-        "batter_singles": (0.5, 2.5),
-        "batter_doubles": (0.5, 1.5),
-        "batter_triples": (0.5, 1.5),
-        "batter_walks": (0.5, 2.5),
-        "batter_strikeouts": (0.5, 2.5),
-        "batter_stolen_bases": (0.5, 2.5),
-        "pitcher_strikeouts": (3.5, 10.5),
-        "pitcher_hits_allowed": (2.5, 7.5),
-        "pitcher_walks": (0.5, 3.5),
-        "pitcher_earned_runs": (0.5, 5.5),
-        "pitcher_outs": (15.5, 21.5),
-        # NHL
-        "player_power_play_points": (0.25, 1.5),
-        "player_blocked_shots": (1.5, 4.5),
-        "player_shots_on_goal": (2.0, 5.5),
-        "player_goals": (0.5, 2.5),
-        "player_total_saves": (24.5, 34.5),
-        # AFL
-        "player_disposals": (15.5, 35.5),
-        "player_disposals_over": (18.5, 32.5),
-        "player_goals_scored_over": (1.5, 4.5),
-        "player_marks_over": (3.5, 12.5),
-        "player_tackles_over": (3.5, 9.5),
-        "player_afl_fantasy_points": (60.5, 120.5),
-        "player_afl_fantasy_points_over": (70.5, 130.5),
-        "player_afl_fantasy_points_most": (70.5, 130.5),
-        # Rugby League
-        "player_try_scorer_over": (0.5, 2.5),
-        # Soccer
-        "player_shots_on_target": (0.5, 3.5),
-        "player_shots": (1.5, 5.5),
-    }
-
-    default_range = (20.5, 35.5)
+    point_ranges = (
+        _DUMMY_PROP_POINT_RANGES
+        if sport_key == "basketball_nba"
+        else _DUMMY_NON_NBA_PROP_POINT_RANGES
+    )
 
     now = datetime.now(timezone.utc)
-    last_update = now.isoformat().replace("+00:00", "Z")
+    last_update = now.strftime(ODDS_API_TIMESTAMP_FORMAT)
+    # Split the requested books once; every generated event uses the same split.
+    novig_book_key = next((bk for bk in bookmaker_keys if bk.lower() == "novig"), None)
+    other_book_keys = [bk for bk in bookmaker_keys if bk.lower() != "novig"]
     events: List[Dict[str, Any]] = []
     for team_name in teams_to_use:
         players = player_map[team_name][:3]
 
         hours_ahead = random.randint(24, 168)
-        commence_time = (now + timedelta(hours=hours_ahead)).isoformat().replace("+00:00", "Z")
+        commence_time = (now + timedelta(hours=hours_ahead)).strftime(ODDS_API_TIMESTAMP_FORMAT)
 
         # Generate opponent team (simplified)
         opponent = random.choice([t for t in player_map.keys() if t != team_name])
@@ -889,14 +924,14 @@ def generate_dummy_player_props_data(
         event_id = f"dummy_{sport_key}_{_slugify(away_team)}_at_{_slugify(home_team)}"
 
         def build_outcomes(market_key: str, *, over_price: int, under_price: int) -> Dict[str, Any]:
-            market_range = point_ranges.get(market_key, default_range)
+            market_range = point_ranges.get(market_key, _DUMMY_PROP_DEFAULT_RANGE)
             if market_key == "player_assists" and sport_key != "basketball_nba":
                 market_range = (0.5, 2.5)
             if market_key == "player_field_goals" and sport_key != "basketball_nba":
                 market_range = (1.5, 3.5)
             outcomes: List[Dict[str, Any]] = []
             for player in players:
-                if market_key in yes_no_markets:
+                if market_key in _DUMMY_YES_NO_PROP_MARKETS:
                     outcomes.append({
                         "name": "Yes",
                         "description": player,
@@ -938,25 +973,20 @@ def generate_dummy_player_props_data(
         bookmakers = []
 
         # Generate Novig odds first (best)
-        for book_key in bookmaker_keys:
-            if book_key.lower() == "novig":
-                novig_markets = [
-                    build_outcomes(market_key, over_price=-105, under_price=-105)
-                    for market_key in selected_markets
-                ]
-                bookmakers.append({
-                    "key": book_key,
-                    "title": book_key.title(),
-                    "markets": novig_markets,
-                    "last_update": last_update,
-                })
-                break
+        if novig_book_key is not None:
+            novig_markets = [
+                build_outcomes(market_key, over_price=-105, under_price=-105)
+                for market_key in selected_markets
+            ]
+            bookmakers.append({
+                "key": novig_book_key,
+                "title": novig_book_key.title(),
+                "markets": novig_markets,
+                "last_update": last_update,
+            })
 
         # Generate other books' odds (worse)
-        for book_key in bookmaker_keys:
-            if book_key.lower() == "novig":
-                continue
-
+        for book_key in other_book_keys:
             over_price = random.choice([-110, -115])
             under_price = random.choice([-110, -115])
             market_payloads = [
@@ -983,6 +1013,82 @@ def generate_dummy_player_props_data(
 
     return events
 
+class OutcomeColumns(NamedTuple):
+    """Parallel views over one book's outcomes for repeated matching."""
+
+    names: List[Optional[str]]
+    points: List[Optional[float]]
+    # Per outcome name: numeric points sorted ascending and their outcome indices.
+    lines_by_name: Dict[Optional[str], Tuple[List[float], List[int]]]
+
+
+def outcome_columns(outcomes: List[Dict[str, Any]]) -> OutcomeColumns:
+    """Split outcome dicts into parallel name/point lists plus sorted lines per name.
+
+    Building the columns once per book lets repeated comparison probes scan flat
+    lists (or bisect the sorted lines) instead of doing ``dict.get`` lookups on
+    every outcome.
+    """
+
+    names = [outcome.get("name") for outcome in outcomes]
+    points = [outcome.get("point", None) for outcome in outcomes]
+
+    grouped: Dict[Optional[str], List[Tuple[float, int]]] = {}
+    for index, (name, point) in enumerate(zip(names, points)):
+        if point is not None:
+            grouped.setdefault(name, []).append((point, index))
+
+    lines_by_name: Dict[Optional[str], Tuple[List[float], List[int]]] = {}
+    for name, lines in grouped.items():
+        lines.sort()
+        lines_by_name[name] = ([p for p, _ in lines], [i for _, i in lines])
+
+    return OutcomeColumns(names, points, lines_by_name)
+
+
+def _closest_line_index(
+    lines: Tuple[List[float], List[int]], point: float, max_diff: float
+) -> Optional[int]:
+    """Bisect sorted lines for the closest point within ``max_diff``.
+
+    Ties resolve the same way as a front-to-back scan: the smallest difference
+    wins (differences under 1e-9 count as exact) and then the earliest outcome.
+    """
+
+    sorted_points, indices = lines
+
+    # Any line within 1e-9 counts as exact; the earliest such outcome wins.
+    exact = [
+        indices[candidate]
+        for candidate in range(
+            bisect_left(sorted_points, point - 1e-9),
+            bisect_right(sorted_points, point + 1e-9),
+        )
+        if abs(point - sorted_points[candidate]) < 1e-9
+    ]
+    if exact:
+        return min(exact)
+
+    position = bisect_left(sorted_points, point)
+    candidates = []
+    if position < len(sorted_points):
+        candidates.append(position)
+    if position > 0:
+        # First entry of the nearest lower line so duplicates keep list order.
+        candidates.append(bisect_left(sorted_points, sorted_points[position - 1]))
+
+    best: Optional[Tuple[float, int]] = None
+    for candidate in candidates:
+        diff = abs(point - sorted_points[candidate])
+        if diff > max_diff:
+            continue
+        key = (diff, indices[candidate])
+        if best is None or key < best:
+            best = key
+
+    return best[1] if best is not None else None
+
+
 def find_best_comparison_outcome(
     *,
     outcomes: List[Dict[str, Any]],
@@ -990,41 +1096,79 @@ def find_best_comparison_outcome(
     point: Optional[float],
     allow_half_point_flex: bool,
     opposite: bool = False,
+    columns: Optional[OutcomeColumns] = None,
 ) -> Optional[Dict[str, Any]]:
     """Return the comparison book outcome that best matches a target book outcome.
 
     When ``opposite`` is True, search for an outcome with a different name (the
     other side of the bet). Preference is given to exact point matches, but for
     spreads/totals we will also accept lines that differ by up to 0.5.
+
+    ``columns`` may carry the precomputed result of :func:`outcome_columns` for
+    ``outcomes`` so callers probing the same book repeatedly avoid rebuilding it.
     """
 
-    best: Optional[Dict[str, Any]] = None
+    if columns is None:
+        columns = outcome_columns(outcomes)
+    # Inlined equivalent of points_match: exact lines within 1e-9, or within half a
+    # point when flex is allowed. This loop runs for every outcome of every book, so
+    # it avoids a helper call per candidate.
+    max_diff = 0.5 + 1e-9 if allow_half_point_flex else 0.0
+
+    if allow_half_point_flex and point is not None:
+        # Flex matching on a numeric line only needs the nearest neighbours of
+        # ``point`` among each eligible side's sorted lines. Exact lines win by
+        # earliest outcome, then the smallest difference, as in the scan below.
+        best: Optional[Tuple[bool, float, int]] = None
+        for comp_name, lines in columns.lines_by_name.items():
+            if (comp_name == name) is opposite:
+                continue
+            index = _closest_line_index(lines, point, max_diff)
+            if index is None:
+                continue
+            diff = abs(point - columns.points[index])
+            key = (False, 0.0, index) if diff < 1e-9 else (True, diff, index)
+            if best is None or key < best:
+                best = key
+        return outcomes[best[2]] if best is not None else None
+
+    names, points = columns.names, columns.points
+
+    best_index: Optional[int] = None
     best_diff: float = float("inf")
 
-    for comp_outcome in outcomes:
-        comp_name = comp_outcome.get("name")
-        if opposite:
-            if comp_name == name:
-                continue
-        elif comp_name != name:
+    for index, comp_name in enumerate(names):
+        # Same-side searches skip other names; opposite-side searches skip this one.
+        if (comp_name == name) is opposite:
             continue
 
-        comp_point = comp_outcome.get("point", None)
-        if not points_match(point, comp_point, allow_half_point_flex):
-            continue
+        comp_point = points[index]
+        if point is None or comp_point is None:
+            if point is not comp_point:
+                continue
+            diff = 0.0
+        else:
+            diff = abs(point - comp_point)
+            if diff >= 1e-9 and diff > max_diff:
+                continue
+
+        # Without the half-point flex only exact lines match, so nothing later
+        # in the list can beat the first hit.
+        if not allow_half_point_flex:
+            return outcomes[index]
 
-        diff = abs((point or 0.0) - (comp_point or 0.0))
         if diff < best_diff:
-            best = comp_outcome
+            best_index = index
             best_diff = diff
 
             # Exact point match is the best we can do
             if diff < 1e-9:
                 break
 
-    return best
+    return outcomes[best_index] if best_index is not None else None
 
 
+@lru_cache(maxsize=4096)
 def normalize_player_name(value: str) -> str:
     """Normalize player names so books with punctuation or accents still match."""
 
@@ -1034,6 +1178,99 @@ def normalize_player_name(value: str) -> str:
     return re.sub(r"[^a-z0-9]", "", ascii_only.lower())
 
 
+def player_prop_outcome_index(
+    outcomes: List[Dict[str, Any]],
+) -> Dict[Optional[str], List[Dict[str, Any]]]:
+    """Group outcomes by normalized player name, keeping their order.
+
+    Each player only has a handful of outcomes (both sides of one or two lines),
+    so same-side and opposite-side lookups both filter this short list. Outcomes
+    without a player description are grouped under ``None``.
+    """
+
+    index: Dict[Optional[str], List[Dict[str, Any]]] = {}
+    for outcome in outcomes:
+        description = outcome.get("description")
+        key = normalize_player_name(description) if description else None
+        index.setdefault(key, []).append(outcome)
+    return index
+
+
+# Stat unit appended to player-prop lines in outcome labels (e.g. "25.5 points").
+PLAYER_PROP_UNITS: Dict[str, str] = {
+    "player_points": "points",
+    "player_points_q1": "points",
+    "player_assists": "assists",
+    "player_assists_q1": "assists",
+    "player_rebounds": "rebounds",
+    "player_rebounds_q1": "rebounds",
+    "player_threes": "3-pointers",
+    "player_blocks": "blocks",
+    "player_steals": "steals",
+    "player_blocks_steals": "blocks + steals",
+    "player_turnovers": "turnovers",
+    "player_points_rebounds_assists": "PRA",
+    "player_points_rebounds": "points + rebounds",
+    "player_points_assists": "points + assists",
+    "player_rebounds_assists": "rebounds + assists",
+    "player_field_goals": "field goals",
+    "player_frees_made": "free throws made",
+    "player_frees_attempts": "free throws attempted",
+    "player_reception_yds": "receiving yards",
+    "player_receptions": "receptions",
+    "player_reception_tds": "receiving TDs",
+    "player_reception_longest": "longest reception",
+    "player_pass_yds_q1": "passing yards",
+    "player_pass_yds": "passing yards",
+    "player_pass_attempts": "pass attempts",
+    "player_pass_completions": "completions",
+    "player_pass_interceptions": "interceptions",
+    "player_pass_longest_completion": "longest completion",
+    "player_pass_rush_yds": "total yards",
+    "player_pass_rush_reception_yds": "total yards",
+    "player_pass_rush_reception_tds": "total TDs",
+    "player_rush_yds": "rushing yards",
+    "player_rush_attempts": "rush attempts",
+    "player_rush_longest": "longest rush",
+    "player_rush_reception_yds": "total yards",
+    "player_rush_reception_tds": "total TDs",
+    "player_rush_tds": "rushing TDs",
+    "player_anytime_td": "touchdowns",
+    "player_tds_over": "touchdowns",
+    "player_pass_tds": "passing TDs",
+    "player_sacks": "sacks",
+    "player_solo_tackles": "solo tackles",
+    "player_tackles_assists": "tackles + assists",
+    "player_kicking_points": "kicking points",
+    "player_pats": "PATS",
+    "player_defensive_interceptions": "defensive INTs",
+    "player_goals": "goals",
+    "player_shots_on_goal": "shots on goal",
+    "player_power_play_points": "power play points",
+    "player_blocked_shots": "blocked shots",
+    "player_total_saves": "saves",
+    "batter_home_runs": "home runs",
+    "batter_hits": "hits",
+    "batter_total_bases": "total bases",
+    "batter_rbis": "RBIs",
+    "batter_runs_scored": "runs",
+    "batter_hits_runs_rbis": "hits + runs + RBIs",
+    "batter_singles": "singles",
+    "batter_doubles": "doubles",
+    "batter_triples": "triples",
+    "batter_walks": "walks",
+    "batter_strikeouts": "strikeouts",
+    "batter_stolen_bases": "stolen bases",
+    "pitcher_strikeouts": "strikeouts",
+    "pitcher_hits_allowed": "hits allowed",
+    "pitcher_walks": "walks",
+    "pitcher_earned_runs": "earned runs",
+    "pitcher_outs": "outs",
+    "player_shots_on_target": "shots on target",
+    "player_shots": "shots",
+}
+
+
 def collect_value_plays(
     events: List[Dict[str, Any]],
     market_key: str,
@@ -1059,6 +1296,11 @@ def collect_value_plays(
 
     is_player_prop = is_player_prop_market(market_key)
     is_totals_market = market_key == "totals"
+    # Allow 0.5-point flex for spreads, totals, and player props (Odds API sometimes
+    # differs by 0.5 between books).
+    allow_half_point_flex = market_key in ("totals", "spreads") or is_player_prop
+    prop_stat_unit = PLAYER_PROP_UNITS.get(market_key, "")
+    prop_stat_label = f" {prop_stat_unit}" if prop_stat_unit else ""
 
     def _log_market_skip(reason_label: str, *, event_id: str, detail: str) -> None:
         """Log standardized skip reasons when a market cannot be evaluated."""
@@ -1116,6 +1358,8 @@ def collect_value_plays(
         *,
         allow_half_point_flex: bool,
         opposite: bool = False,
+        columns: Optional[OutcomeColumns] = None,
+        prop_index: Optional[Dict[Optional[str], List[Dict[str, Any]]]] = None,
     ) -> Optional[Dict[str, Any]]:
         """Find the best matching outcome for a selection, favoring player/point matches.
 
@@ -1132,6 +1376,21 @@ def collect_value_plays(
                 else None
             )
 
+            match_points = points_matcher(allow_half_point_flex)
+            if normalized_desc and prop_index is not None:
+                # Fast path: the first same-player outcome on the requested side (or
+                # the other side when ``opposite``) with a matching line is what the
+                # full scan below would return as well.
+                for comp_outcome in prop_index.get(normalized_desc, ()):
+                    if (comp_outcome.get("name") == expected_name) is opposite:
+                        continue
+                    if match_points(expected_point, comp_outcome.get("point", None)):
+                        return comp_outcome
+                if None not in prop_index:
+                    # Every outcome names its player, so the scan below could only
+                    # find other players' outcomes, which it refuses to pair with.
+                    return None
+
             candidates: List[Dict[str, Any]] = []
             for comp_outcome in outcomes:
                 comp_name = comp_outcome.get("name")
@@ -1142,7 +1401,7 @@ def collect_value_plays(
                     continue
 
                 comp_point = comp_outcome.get("point", None)
-                if not points_match(expected_point, comp_point, allow_half_point_flex):
+                if not match_points(expected_point, comp_point):
                     continue
 
                 candidates.append(comp_outcome)
@@ -1170,6 +1429,7 @@ def collect_value_plays(
             point=expected_point,
             allow_half_point_flex=allow_half_point_flex,
             opposite=opposite,
+            columns=columns,
         )
     
     for event in events:
@@ -1181,7 +1441,7 @@ def collect_value_plays(
         # Skip events that have already started (live or completed)
         if start_time:
             try:
-                event_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+                event_dt = parse_iso_datetime(start_time)
                 if event_dt <= now_utc:
                     # Event has started or is live, skip it
                     continue
@@ -1197,6 +1457,8 @@ def collect_value_plays(
         compare_market = None
         book_market = None
         market_outcomes_by_book: Dict[str, List[Dict[str, Any]]] = {}
+        outcome_columns_by_book: Dict[str, OutcomeColumns] = {}
+        prop_index_by_book: Dict[str, Dict[Optional[str], List[Dict[str, Any]]]] = {}
 
         for bookmaker in event.get("bookmakers", []):
             key = bookmaker.get("key")
@@ -1212,6 +1474,10 @@ def collect_value_plays(
                 continue
 
             market_outcomes_by_book[key] = sanitized_outcomes
+            if is_player_prop:
+                prop_index_by_book[key] = player_prop_outcome_index(sanitized_outcomes)
+            else:
+                outcome_columns_by_book[key] = outcome_columns(sanitized_outcomes)
 
             if key == compare_book:
                 compare_market = market
@@ -1229,15 +1495,10 @@ def collect_value_plays(
         # For moneylines, only process events where the target book has posted both sides.
         # This avoids calculating synthetic prices when the sportsbook has not actually
         # published the moneyline market yet.
+        # Outcomes are already sanitized, so every entry carries a usable price.
         book_outcomes = market_outcomes_by_book.get(target_book, [])
         if market_key == "h2h":
-            posted_prices = [
-                sanitized_price
-                for o in book_outcomes
-                for sanitized_price in [sanitize_american_price(o.get("price"))]
-                if sanitized_price is not None
-            ]
-            if len(posted_prices) < 2:
+            if len(book_outcomes) < 2:
                 _log_market_skip(
                     "SKIP_INVALID_ODDS",
                     event_id=event_id,
@@ -1245,10 +1506,9 @@ def collect_value_plays(
                 )
                 continue
 
-        # Allow 0.5-point flex for spreads, totals, and player props (Odds API sometimes
-        # differs by 0.5 between books).
-        allow_half_point_flex = market_key in ("totals", "spreads") or is_player_prop
         compare_outcomes: List[Dict[str, Any]] = market_outcomes_by_book.get(compare_book, [])
+        compare_columns = outcome_columns_by_book.get(compare_book)
+        compare_prop_index = prop_index_by_book.get(compare_book)
         if not compare_outcomes:
             _log_market_skip(
                 "SKIP_INVALID_ODDS",
@@ -1258,60 +1518,37 @@ def collect_value_plays(
             continue
 
         def _collect_prices_for_selection(
-            outcome_name: str, outcome_description: Optional[str], outcome_point: Optional[float]
+            outcome_name: str,
+            outcome_description: Optional[str],
+            outcome_point: Optional[float],
+            known_prices: Dict[str, Optional[int]],
         ) -> Dict[str, Optional[int]]:
+            """Price the selection at every book, reusing prices already matched."""
+
             prices: Dict[str, Optional[int]] = {}
             for book_key, outcomes in market_outcomes_by_book.items():
+                if book_key in known_prices:
+                    prices[book_key] = known_prices[book_key]
+                    continue
                 match = _find_matching_outcome(
                     outcomes,
                     expected_name=outcome_name,
                     expected_description=outcome_description,
                     expected_point=outcome_point,
                     allow_half_point_flex=allow_half_point_flex,
+                    columns=outcome_columns_by_book.get(book_key),
+                    prop_index=prop_index_by_book.get(book_key),
                 )
                 prices[book_key] = match.get("price") if match and match.get("price") is not None else None
             return prices
 
         for o in book_outcomes:
-            name = o.get("name")
-            price = sanitize_american_price(o.get("price"))
-            point = o.get("point", None)
-            description = o.get("description", None)  # For player props, this is the player name
-            if name is None or price is None:
-                _log_market_skip(
-                    "SKIP_INVALID_ODDS",
-                    event_id=event_id,
-                    detail="target outcome missing name or price",
-                )
-                continue
-
-            # For totals markets, outcomes MUST have a point value (totals always have a line)
-            # Also validate that the name is "Over" or "Under" for totals
-            # Totals odds should be in a reasonable range (typically -150 to +150, not like -300 which is ML territory)
-            if market_key == "totals":
-                if point is None:
-                    _log_market_skip(
-                        "SKIP_INVALID_ODDS",
-                        event_id=event_id,
-                        detail="totals outcome missing point value",
-                    )
-                    continue
-                if name.lower() not in ("over", "under"):
-                    _log_market_skip(
-                        "SKIP_INVALID_ODDS",
-                        event_id=event_id,
-                        detail="totals outcome has invalid side label",
-                    )
-                    continue  # Skip invalid totals outcomes
-                # Skip totals with extreme prices that look like moneyline odds (e.g., -300, +400)
-                # Totals typically range from -150 to +150
-                if price is not None and (price < -150 or price > 150):
-                    _log_market_skip(
-                        "SKIP_INVALID_ODDS",
-                        event_id=event_id,
-                        detail="totals price outside expected range",
-                    )
-                    continue  # Skip suspiciously extreme totals prices
+            # _sanitize_outcomes already dropped entries without a name or usable
+            # price and applied the totals side/line/price-range checks.
+            name = o["name"]
+            price = o["price"]
+            point = o["point"]
+            description = o["description"]  # For player props, this is the player name
 
             if market_key in ("totals", "spreads"):
                 # For spreads/totals, use the raw book price to avoid inflating lines like
@@ -1333,6 +1570,8 @@ def collect_value_plays(
                 expected_description=description,
                 expected_point=point,
                 allow_half_point_flex=allow_half_point_flex,
+                columns=compare_columns,
+                prop_index=compare_prop_index,
             )
             if matching_compare is None:
                 _log_market_skip(
@@ -1342,8 +1581,8 @@ def collect_value_plays(
                 )
                 continue
             # For spreads/totals arbitrage comparisons, require the exact same point line
-            if market_key in ("totals", "spreads") and not points_match(
-                point, matching_compare.get("point"), allow_half_point_flex=False
+            if market_key in ("totals", "spreads") and not points_match_exact(
+                point, matching_compare.get("point")
             ):
                 continue
 
@@ -1358,6 +1597,7 @@ def collect_value_plays(
                     expected_description=description,
                     expected_point=point,
                     allow_half_point_flex=allow_half_point_flex,
+                    prop_index=compare_prop_index,
                 )
             else:
                 other_compare = _find_matching_outcome(
@@ -1367,10 +1607,11 @@ def collect_value_plays(
                     expected_point=point,
                     allow_half_point_flex=allow_half_point_flex,
                     opposite=True,
+                    columns=compare_columns,
                 )
             if market_key in ("totals", "spreads") and other_compare is not None:
                 # Require the hedge side to share the same point to avoid mismatched lines
-                if not points_match(point, other_compare.get("point"), allow_half_point_flex=False):
+                if not points_match_exact(point, other_compare.get("point")):
                     other_compare = None
 
             # Require an opposite-side price so we only surface hedgeable bets
@@ -1398,7 +1639,9 @@ def collect_value_plays(
                 )
                 continue
 
-            ev_pct = estimate_ev_percent(book_odds=adjusted_price, sharp_odds=compare_price)
+            # Shared by the EV estimate and the hedge margin below.
+            d_book = american_to_decimal(adjusted_price)
+            ev_pct = estimate_ev_percent_from_decimal(d_book, compare_price)
 
             novig_reverse_name: Optional[str] = None
             novig_reverse_price: Optional[int] = None
@@ -1413,7 +1656,6 @@ def collect_value_plays(
                 # 2-way arb math:
                 #  - back this side at target_book (book_price with vig adjustment)
                 #  - back opposite side at comparison book (novig_reverse_price)
-                d_book = american_to_decimal(adjusted_price)
                 d_compare_other = american_to_decimal(novig_reverse_price)
                 inv_sum = 1.0 / d_book + 1.0 / d_compare_other
                 # Hedge margin: 0% ~ fair (e.g. -125 / +125), >0% profitable arb, <0% losing hedge
@@ -1427,84 +1669,10 @@ def collect_value_plays(
 
             # For player props, include player name and line in outcome_name
             outcome_display_name = name
-            player_prop_units = {
-                "player_points": "points",
-                "player_points_q1": "points",
-                "player_assists": "assists",
-                "player_assists_q1": "assists",
-                "player_rebounds": "rebounds",
-                "player_rebounds_q1": "rebounds",
-                "player_threes": "3-pointers",
-                "player_blocks": "blocks",
-                "player_steals": "steals",
-                "player_blocks_steals": "blocks + steals",
-                "player_turnovers": "turnovers",
-                "player_points_rebounds_assists": "PRA",
-                "player_points_rebounds": "points + rebounds",
-                "player_points_assists": "points + assists",
-                "player_rebounds_assists": "rebounds + assists",
-                "player_field_goals": "field goals",
-                "player_frees_made": "free throws made",
-                "player_frees_attempts": "free throws attempted",
-                "player_reception_yds": "receiving yards",
-                "player_receptions": "receptions",
-                "player_reception_tds": "receiving TDs",
-                "player_reception_longest": "longest reception",
-                "player_pass_yds_q1": "passing yards",
-                "player_pass_yds": "passing yards",
-                "player_pass_attempts": "pass attempts",
-                "player_pass_completions": "completions",
-                "player_pass_interceptions": "interceptions",
-                "player_pass_longest_completion": "longest completion",
-                "player_pass_rush_yds": "total yards",
-                "player_pass_rush_reception_yds": "total yards",
-                "player_pass_rush_reception_tds": "total TDs",
-                "player_rush_yds": "rushing yards",
-                "player_rush_attempts": "rush attempts",
-                "player_rush_longest": "longest rush",
-                "player_rush_reception_yds": "total yards",
-                "player_rush_reception_tds": "total TDs",
-                "player_rush_tds": "rushing TDs",
-                "player_anytime_td": "touchdowns",
-                "player_tds_over": "touchdowns",
-                "player_pass_tds": "passing TDs",
-                "player_sacks": "sacks",
-                "player_solo_tackles": "solo tackles",
-                "player_tackles_assists": "tackles + assists",
-                "player_kicking_points": "kicking points",
-                "player_pats": "PATS",
-                "player_defensive_interceptions": "defensive INTs",
-                "player_goals": "goals",
-                "player_shots_on_goal": "shots on goal",
-                "player_power_play_points": "power play points",
-                "player_blocked_shots": "blocked shots",
-                "player_total_saves": "saves",
-                "batter_home_runs": "home runs",
-                "batter_hits": "hits",
-                "batter_total_bases": "total bases",
-                "batter_rbis": "RBIs",
-                "batter_runs_scored": "runs",
-                "batter_hits_runs_rbis": "hits + runs + RBIs",
-                "batter_singles": "singles",
-                "batter_doubles": "doubles",
-                "batter_triples": "triples",
-                "batter_walks": "walks",
-                "batter_strikeouts": "strikeouts",
-                "batter_stolen_bases": "stolen bases",
-                "pitcher_strikeouts": "strikeouts",
-                "pitcher_hits_allowed": "hits allowed",
-                "pitcher_walks": "walks",
-                "pitcher_earned_runs": "earned runs",
-                "pitcher_outs": "outs",
-                "player_shots_on_target": "shots on target",
-                "player_shots": "shots",
-            }
             if is_player_prop and description:
                 line_suffix = ""
                 if point is not None:
-                    stat_unit = player_prop_units.get(market_key, "")
-                    stat_label = f" {stat_unit}" if stat_unit else ""
-                    line_suffix = f" {point}{stat_label}"
+                    line_suffix = f" {point}{prop_stat_label}"
                 outcome_display_name = f"{description} {name}{line_suffix}"
             # For totals, include the point value in outcome_name (e.g., "Over 225.5")
             elif market_key == "totals" and point is not None:
@@ -1515,9 +1683,7 @@ def collect_value_plays(
                 reverse_desc = other_compare.get("description")
                 reverse_line_suffix = ""
                 if point is not None:
-                    stat_unit = player_prop_units.get(market_key, "")
-                    stat_label = f" {stat_unit}" if stat_unit else ""
-                    reverse_line_suffix = f" {point}{stat_label}"
+                    reverse_line_suffix = f" {point}{prop_stat_label}"
                 reverse_display_name = (
                     f"{reverse_desc} {novig_reverse_name}{reverse_line_suffix}"
                     if novig_reverse_name
@@ -1527,17 +1693,26 @@ def collect_value_plays(
             elif market_key == "totals" and novig_reverse_name and point is not None:
                 reverse_display_name = f"{novig_reverse_name} {point}"
 
-            book_prices = _collect_prices_for_selection(name, description, point)
+            # The target outcome and its comparison match are already in hand, so
+            # only the remaining display books need a lookup.
+            book_prices = _collect_prices_for_selection(
+                name,
+                description,
+                point,
+                {target_book: price, compare_book: compare_price},
+            )
             hedge_prices: Dict[str, Optional[int]] = {}
             if other_compare is not None:
                 hedge_prices = _collect_prices_for_selection(
                     other_compare.get("name", novig_reverse_name or ""),
                     other_compare.get("description", description),
                     other_compare.get("point", point),
+                    {compare_book: novig_reverse_price},
                 )
 
+            # Every field below comes from sanitized book data, so skip re-validation.
             plays.append(
-                ValuePlayOutcome(
+                ValuePlayOutcome.model_construct(
                     event_id=event_id,
                     matchup=matchup,
                     start_time=start_time,
@@ -1562,7 +1737,9 @@ def collect_value_plays(
 # FastAPI app
 # -------------------------------------------------------------------
 
-app = FastAPI()
+# Value-play and player-prop responses carry hundreds of plays; orjson renders
+# them several times faster than the stdlib encoder when it is installed.
+app = FastAPI(default_response_class=ORJSONResponse if orjson is not None else JSONResponse)
 
 
 def _validate_data_source(events: List[Dict[str, Any]], allow_dummy: bool) -> None:
@@ -1593,6 +1770,10 @@ odds_repository = OddsRepository(
 
 snapshot_holder = SnapshotHolder()
 results_store = ResultsStore()
+# On-demand mode has no snapshot to version results by, so identical live requests
+# share one computed response for the same window as the underlying odds cache.
+LIVE_RESULT_TTL_SECONDS = 5
+live_results = LiveResultCache(ttl=LIVE_RESULT_TTL_SECONDS)
 
 
 def _provide_snapshot_events(
@@ -1806,6 +1987,45 @@ def _load_sports_schema() -> list:
         return []
 
 
+def _ensure_distinct_books(target_book: str, compare_book: str) -> None:
+    """Reject two-book comparisons that point at the same sportsbook."""
+
+    if target_book == compare_book:
+        raise HTTPException(
+            status_code=400,
+            detail="Target book and comparison book cannot be the same.",
+        )
+
+
+def _snapshot_cached_response(
+    scope: str,
+    payload: BaseModel,
+    snapshot: Optional[OddsSnapshot],
+    build: Callable[[], Any],
+    use_dummy_data: bool = False,
+) -> Any:
+    """Serve ``scope`` from the results store for this snapshot, building it on a miss.
+
+    Without a snapshot (on-demand mode) live responses are reused for
+    ``LIVE_RESULT_TTL_SECONDS`` and concurrent identical requests wait on a single
+    build; dummy-data responses are always rebuilt.
+    """
+
+    cache_key = payload.model_dump()
+    if snapshot is None:
+        if use_dummy_data:
+            return build()
+        return live_results.get_or_build(scope=scope, params=cache_key, build=build)
+
+    cached = results_store.get(scope=scope, params=cache_key, snapshot=snapshot)
+    if cached:
+        return cached
+
+    response = build()
+    results_store.set(scope=scope, params=cache_key, snapshot=snapshot, value=response)
+    return response
+
+
 @app.get("/api/sports")
 def get_sports_schema():
     """Return the sports schema JSON used to drive frontend sport selectors.
@@ -1882,40 +2102,25 @@ def get_value_plays(payload: ValuePlaysRequest) -> ValuePlaysResponse:
         negative values indicate a losing hedge.
       - Plays with no comparison book opposite side are pushed to the bottom.
     """
-    target_book = payload.target_book
-    compare_book = payload.compare_book
-    if target_book == compare_book:
-        raise HTTPException(
-            status_code=400,
-            detail="Target book and comparison book cannot be the same.",
-        )
+    _ensure_distinct_books(payload.target_book, payload.compare_book)
 
     snapshot, use_dummy_data = _resolve_data_context(payload.use_dummy_data)
 
-    domain_request = domain_mappers.map_value_plays_query(payload)
-    cache_key = payload.model_dump()
-    cached = None
-    if snapshot:
-        cached = results_store.get(
-            scope="value-plays", params=cache_key, snapshot=snapshot
+    def _build() -> ValuePlaysResponse:
+        domain_result = value_play_service.get_value_plays(
+            payload=domain_mappers.map_value_plays_query(payload),
+            use_dummy_data=use_dummy_data,
+            snapshot=snapshot,
+        )
+        return domain_mappers.map_value_plays_result_to_dto(
+            domain_result,
+            value_play_model=ValuePlayOutcome,
+            response_model=ValuePlaysResponse,
         )
-        if cached:
-            return cached
-
-    domain_result = value_play_service.get_value_plays(
-        payload=domain_request, use_dummy_data=use_dummy_data, snapshot=snapshot
-    )
 
-    response = domain_mappers.map_value_plays_result_to_dto(
-        domain_result,
-        value_play_model=ValuePlayOutcome,
-        response_model=ValuePlaysResponse,
+    return _snapshot_cached_response(
+        "value-plays", payload, snapshot, _build, use_dummy_data=use_dummy_data
     )
-    if snapshot:
-        results_store.set(
-            scope="value-plays", params=cache_key, snapshot=snapshot, value=response
-        )
-    return response
 
 
 @app.post("/api/best-value-plays", response_model=BestValuePlaysResponse)
@@ -1924,14 +2129,7 @@ def get_best_value_plays(payload: BestValuePlaysRequest) -> BestValuePlaysRespon
     Search across multiple sports and markets to find the best +EV bets by hedge odds.
     Returns the top value plays sorted by arb_margin_percent (hedge opportunity).
     """
-    target_book = payload.target_book
-    compare_book = payload.compare_book
-
-    if target_book == compare_book:
-        raise HTTPException(
-            status_code=400,
-            detail="Target book and comparison book cannot be the same.",
-        )
+    _ensure_distinct_books(payload.target_book, payload.compare_book)
 
     if not payload.sport_keys or not payload.markets:
         raise HTTPException(
@@ -1941,34 +2139,22 @@ def get_best_value_plays(payload: BestValuePlaysRequest) -> BestValuePlaysRespon
 
     snapshot, use_dummy_data = _resolve_data_context(payload.use_dummy_data)
 
-    domain_payload = domain_mappers.map_best_value_plays_query(payload)
-    cache_key = payload.model_dump()
-    cached = None
-    if snapshot:
-        cached = results_store.get(
-            scope="best-value-plays", params=cache_key, snapshot=snapshot
+    def _build() -> BestValuePlaysResponse:
+        domain_result = value_play_service.get_best_value_plays(
+            payload=domain_mappers.map_best_value_plays_query(payload),
+            use_dummy_data=use_dummy_data,
+            snapshot=snapshot,
+        )
+        return domain_mappers.map_best_value_plays_result_to_dto(
+            domain_result,
+            best_value_model=BestValuePlayOutcome,
+            response_model=BestValuePlaysResponse,
         )
-        if cached:
-            return cached
 
-    domain_result = value_play_service.get_best_value_plays(
-        payload=domain_payload, use_dummy_data=use_dummy_data, snapshot=snapshot
+    return _snapshot_cached_response(
+        "best-value-plays", payload, snapshot, _build, use_dummy_data=use_dummy_data
     )
 
-    response = domain_mappers.map_best_value_plays_result_to_dto(
-        domain_result,
-        best_value_model=BestValuePlayOutcome,
-        response_model=BestValuePlaysResponse,
-    )
-    if snapshot:
-        results_store.set(
-            scope="best-value-plays",
-            params=cache_key,
-            snapshot=snapshot,
-            value=response,
-        )
-    return response
-
 
 def _clamp_boost_percent(boost_percent: Optional[float]) -> float:
     if boost_percent is None:
@@ -1980,12 +2166,10 @@ def _combine_leg_odds(legs: List[ValuePlayOutcome]) -> tuple[Optional[float], Op
     if not legs:
         return None, None
 
-    combined_decimal = 1.0
-    for leg in legs:
-        try:
-            combined_decimal *= american_to_decimal(leg.book_price)
-        except Exception:
-            return None, None
+    try:
+        combined_decimal = math.prod(american_to_decimal(leg.book_price) for leg in legs)
+    except Exception:
+        return None, None
 
     american = decimal_to_american(combined_decimal)
     return combined_decimal, american
@@ -2010,19 +2194,21 @@ def _hedge_value(play: ValuePlayOutcome) -> float:
 def _select_top_parlay_legs(
     plays: List[BestValuePlayOutcome], desired_legs: int
 ) -> List[BestValuePlayOutcome]:
-    sorted_plays = sorted(plays, key=_hedge_value, reverse=True)
-    legs: List[BestValuePlayOutcome] = []
-    seen_events: Set[str] = set()
-
-    for play in sorted_plays:
-        if play.event_id in seen_events:
-            continue
-        legs.append(play)
-        seen_events.add(play.event_id)
-        if len(legs) >= desired_legs:
-            break
-
-    return legs
+    # Keep each event's strongest play (the earliest one on ties, as a stable
+    # sort would), then pull the top events without sorting every play.
+    best_by_event: Dict[str, Tuple[float, int, BestValuePlayOutcome]] = {}
+    for idx, play in enumerate(plays):
+        value = _hedge_value(play)
+        current = best_by_event.get(play.event_id)
+        if current is None or value > current[0]:
+            best_by_event[play.event_id] = (value, -idx, play)
+
+    return [
+        play
+        for _, _, play in heapq.nlargest(
+            desired_legs, best_by_event.values(), key=lambda entry: entry[:2]
+        )
+    ]
 
 
 @app.post("/api/parlay-builder", response_model=ParlayBuilderResponse)
@@ -2316,7 +2502,7 @@ def _filter_upcoming_events_only(events: List[Dict[str, Any]]) -> List[Dict[str,
             return None
 
         try:
-            parsed = datetime.fromisoformat(raw_value.replace("Z", "+00:00"))
+            parsed = parse_iso_datetime(raw_value)
         except Exception:
             return None
 
@@ -2344,7 +2530,7 @@ def _extract_latest_update_timestamp(events: List[Dict[str, Any]]) -> Optional[s
             return None
 
         try:
-            dt = datetime.fromisoformat(raw_value.replace("Z", "+00:00"))
+            dt = parse_iso_datetime(raw_value)
         except Exception:
             return None
 
@@ -2402,7 +2588,7 @@ def _featured_game_score(event: Dict[str, Any]) -> float:
     recency_score = 0.0
     if commence_time:
         try:
-            event_dt = datetime.fromisoformat(commence_time.replace("Z", "+00:00"))
+            event_dt = parse_iso_datetime(commence_time)
             hours_until = (event_dt - datetime.now(timezone.utc)).total_seconds() / 3600
             if 0 <= hours_until <= FEATURED_LOOKAHEAD_HOURS:
                 recency_score = (FEATURED_LOOKAHEAD_HOURS - hours_until) / FEATURED_LOOKAHEAD_HOURS
@@ -2425,7 +2611,7 @@ def _within_featured_window(event: Dict[str, Any]) -> bool:
         return False
 
     try:
-        event_dt = datetime.fromisoformat(commence_time.replace("Z", "+00:00"))
+        event_dt = parse_iso_datetime(commence_time)
     except Exception:
         return False
 
@@ -2685,11 +2871,7 @@ def get_player_props(payload: PlayerPropsRequest) -> PlayerPropsResponse:
             payload.player_name,
         )
 
-    if target_book == compare_book:
-        raise HTTPException(
-            status_code=400,
-            detail="Target book and comparison book cannot be the same.",
-        )
+    _ensure_distinct_books(target_book, compare_book)
 
     snapshot, use_dummy_data = _resolve_data_context(payload.use_dummy_data)
 
@@ -2840,14 +3022,13 @@ def get_player_props(payload: PlayerPropsRequest) -> PlayerPropsResponse:
             if not p.start_time:
                 continue
             try:
-                dt = datetime.fromisoformat(p.start_time.replace("Z", "+00:00"))
+                dt = parse_iso_datetime(p.start_time)
             except Exception:
                 continue
             if dt <= now_utc:
                 continue
 
-            if p.start_time:
-                p.start_time = format_start_time_est(p.start_time)
+            p.start_time = format_datetime_est(dt)
             if not p.market:
                 p.market = market_key
             all_filtered.append(p)
@@ -2923,15 +3104,14 @@ def get_all_sport_player_prop_arbitrage(
                 continue
 
             try:
-                dt = datetime.fromisoformat(play.start_time.replace("Z", "+00:00"))
+                dt = parse_iso_datetime(play.start_time)
             except Exception:
                 continue
 
             if dt <= now_utc:
                 continue
 
-            if play.start_time:
-                play.start_time = format_start_time_est(play.start_time)
+            play.start_time = format_datetime_est(dt)
             if not play.market:
                 play.market = market_key
             filtered.append(play)
@@ -2983,9 +3163,11 @@ def get_all_sport_player_prop_arbitrage(
                     if play.arb_margin_percent is None:
                         continue
 
+                    # The play was already built from sanitized data; copy it over
+                    # without running validation a second time.
                     all_plays.append(
-                        PlayerPropArbOutcome(
-                            **play.dict(),
+                        PlayerPropArbOutcome.model_construct(
+                            **play.model_dump(),
                             sport_key=sport_key,
                             target_book=target_book,
                         )
@@ -2996,11 +3178,13 @@ def get_all_sport_player_prop_arbitrage(
             return play.arb_margin_percent
         return -1_000_000.0 + play.ev_percent
 
-    all_plays = sorted(all_plays, key=_arb_sort_key, reverse=True)
-
+    # A sweep across every target book can yield far more plays than are
+    # returned, so select the top ``max_results`` without sorting the rest.
     max_results = payload.max_results or 100
     if max_results > 0:
-        all_plays = all_plays[:max_results]
+        all_plays = heapq.nlargest(max_results, all_plays, key=_arb_sort_key)
+    else:
+        all_plays = sorted(all_plays, key=_arb_sort_key, reverse=True)
 
     return PlayerPropArbitrageResponse(
         compare_book=compare_book,
@@ -3029,13 +3213,14 @@ def check_active_odds(sport: str, bookmaker: str):
     )
 
     now_utc = datetime.now(timezone.utc)
+    bookmaker_lower = bookmaker.lower()
     for event in events:
         for bookmaker_data in event.get("bookmakers", []):
-            if bookmaker_data.get("key", "").lower() == bookmaker.lower():
+            if bookmaker_data.get("key", "").lower() == bookmaker_lower:
                 start_time = event.get("commence_time")
                 if start_time:
                     try:
-                        event_dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+                        event_dt = parse_iso_datetime(start_time)
                         if event_dt > now_utc:
                             return {"has_active_odds": True}
                     except Exception:
@@ -3091,6 +3276,19 @@ def get_api_credits():
     }
 
 
+@app.post("/api/cache/invalidate")
+def invalidate_caches():
+    """
+    Drop cached upstream odds responses and computed results so the next
+    request is rebuilt from fresh data. The loaded snapshot itself is kept;
+    it is replaced on the scheduler's next refresh.
+    """
+    clear_odds_cache()
+    results_store.clear()
+    live_results.clear()
+    return {"status": "ok"}
+
+
 class SMSAlertRequest(BaseModel):
     phone: str
     message: str
@@ -3178,20 +3376,24 @@ def _extract_line_tracker_markets(
     away = event.get("away_team")
 
     per_book: Dict[str, Dict[str, Any]] = {}
+    wanted_books = set(bookmaker_keys)
 
     for bookmaker in event.get("bookmakers", []):
         book_key = bookmaker.get("key")
-        if book_key not in bookmaker_keys:
+        if book_key not in wanted_books:
             continue
 
+        # Index the book's markets once instead of rescanning them per market type;
+        # the first market listed under a key wins, as with the previous scans.
+        markets_by_key: Dict[Any, Dict[str, Any]] = {}
+        for market in bookmaker.get("markets", []):
+            markets_by_key.setdefault(market.get("key"), market)
+
         book_entry: Dict[str, Any] = {}
 
         # Moneyline (h2h)
         if track_ml:
-            h2h_market = next(
-                (m for m in bookmaker.get("markets", []) if m.get("key") == "h2h"),
-                None,
-            )
+            h2h_market = markets_by_key.get("h2h")
             if h2h_market:
                 home_price = None
                 away_price = None
@@ -3209,10 +3411,7 @@ def _extract_line_tracker_markets(
 
         # Spreads
         if track_spreads:
-            spread_market = next(
-                (m for m in bookmaker.get("markets", []) if m.get("key") == "spreads"),
-                None,
-            )
+            spread_market = markets_by_key.get("spreads")
             if spread_market:
                 home_point = None
                 home_price = None
@@ -3236,10 +3435,7 @@ def _extract_line_tracker_markets(
 
         # Totals
         if track_totals:
-            totals_market = next(
-                (m for m in bookmaker.get("markets", []) if m.get("key") == "totals"),
-                None,
-            )
+            totals_market = markets_by_key.get("totals")
             if totals_market:
                 total_point = None
                 over_price = None
@@ -3422,7 +3618,7 @@ def get_line_tracker_snapshot(payload: LineTrackerRequest) -> LineTrackerSnapsho
         "regions": regions,
         "markets": markets_to_request,
         "bookmaker_keys": payload.bookmaker_keys,
-        "events": [e.dict() for e in snapshot_events],
+        "events": [e.model_dump() for e in snapshot_events],
     }
 
     # Persist snapshot to logs for later analysis.
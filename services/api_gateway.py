@@ -2,9 +2,65 @@
 from __future__ import annotations
 
 import threading
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_POOL_CONNECTIONS = 8
+HTTP_POOL_MAXSIZE = 32
+# Outbound calls allowed in flight at once through a single gateway.
+GATEWAY_MAX_CONCURRENCY = 4
+
+
+def build_http_session() -> requests.Session:
+    """Return a session that keeps connections to upstream APIs alive.
+
+    Reusing pooled connections avoids a fresh TCP/TLS handshake for every call.
+    Transient gateway errors (502/503/504) are retried twice with a short backoff;
+    when retries run out the last response is returned so callers keep handling
+    non-200 statuses themselves. Connection and read errors are not retried so
+    failures still surface immediately.
+    """
+
+    retry = Retry(
+        total=2,
+        connect=0,
+        read=0,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SHARED_SESSION: Optional[requests.Session] = None
+_SHARED_SESSION_LOCK = threading.Lock()
+
+
+def get_shared_http_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use.
+
+    Direct Odds API calls and the snapshot gateway both talk to the same host, so
+    sharing one pool lets either path reuse connections the other has opened.
+    """
+
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None:
+        with _SHARED_SESSION_LOCK:
+            if _SHARED_SESSION is None:
+                _SHARED_SESSION = build_http_session()
+    return _SHARED_SESSION
 
 
 class ApiGateway:
@@ -15,11 +71,14 @@ class ApiGateway:
         *,
         allowed_callers: Iterable[str] | None = None,
         timeout: int = 15,
+        session: Optional[requests.Session] = None,
+        max_concurrency: int = GATEWAY_MAX_CONCURRENCY,
     ) -> None:
         default_callers = {"snapshot_loader", "on_demand_api"}
         self._allowed_callers = set(allowed_callers or default_callers)
         self._timeout = timeout
-        self._lock = threading.Lock()
+        self._session = session or get_shared_http_session()
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrency))
 
     def _ensure_allowed(self, caller: str) -> None:
         if caller not in self._allowed_callers:
@@ -35,9 +94,9 @@ class ApiGateway:
         snapshot loader path.
         """
         self._ensure_allowed(caller)
-        # A lock avoids flooding external services when multiple snapshot iterations
-        # overlap; it keeps the gateway usage serialized without impacting the rest
-        # of the application.
-        with self._lock:
-            return requests.get(url, params=params, timeout=self._timeout)
+        # A small semaphore avoids flooding external services when snapshot
+        # iterations or fan-outs overlap, while still letting the per-sport and
+        # per-market fetches of a single request run side by side.
+        with self._slots:
+            return self._session.get(url, params=params, timeout=self._timeout)
 
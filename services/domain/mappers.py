@@ -1,4 +1,9 @@
-"""Mapping helpers between domain models and transport DTOs."""
+"""Mapping helpers between domain models and transport DTOs.
+
+Domain objects are built in-process from already sanitized values, so the
+transport models are created with ``model_construct`` to skip re-validation.
+FastAPI still validates the final payload against each route's response model.
+"""
 from __future__ import annotations
 
 from typing import Iterable, List
@@ -33,7 +38,7 @@ def map_odds_result_to_dto(
     bet_dtos = []
     for bet in odds_result.bets:
         prices = [
-            price_out_model(
+            price_out_model.model_construct(
                 bookmaker_key=price.bookmaker_key,
                 bookmaker_name=price.bookmaker_name,
                 price=price.price,
@@ -42,7 +47,7 @@ def map_odds_result_to_dto(
             for price in bet.prices
         ]
         bet_dtos.append(
-            single_bet_odds_model(
+            single_bet_odds_model.model_construct(
                 sport_key=bet.sport_key,
                 market=bet.market,
                 team=bet.team,
@@ -51,7 +56,7 @@ def map_odds_result_to_dto(
             )
         )
 
-    return odds_response_model(bets=bet_dtos)
+    return odds_response_model.model_construct(bets=bet_dtos)
 
 
 def map_value_play_dto_to_domain(play) -> models.ValuePlay:
@@ -78,7 +83,7 @@ def map_value_play_dto_to_domain(play) -> models.ValuePlay:
 def map_value_play_domain_to_dto(play: models.ValuePlay, *, value_play_model):
     """Convert a domain ValuePlay to a transport DTO."""
 
-    return value_play_model(
+    return value_play_model.model_construct(
         event_id=play.event_id,
         matchup=play.matchup,
         start_time=play.start_time,
@@ -105,7 +110,7 @@ def map_value_plays_result_to_dto(
     """Map a ValuePlaysResult domain object to its transport response."""
 
     plays = [map_value_play_domain_to_dto(play, value_play_model=value_play_model) for play in result.plays]
-    return response_model(
+    return response_model.model_construct(
         target_book=result.target_book,
         compare_book=result.compare_book,
         market=result.market,
@@ -118,7 +123,7 @@ def map_best_value_play_domain_to_dto(
 ):
     """Convert a domain BestValuePlay to a transport DTO."""
 
-    return best_value_model(
+    return best_value_model.model_construct(
         sport_key=play.sport_key,
         market=play.market,
         event_id=play.event_id,
@@ -149,7 +154,7 @@ def map_best_value_plays_result_to_dto(
         map_best_value_play_domain_to_dto(play, best_value_model=best_value_model)
         for play in result.plays
     ]
-    return response_model(
+    return response_model.model_construct(
         target_book=result.target_book,
         compare_book=result.compare_book,
         plays=plays,
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceQuote:
     bookmaker_key: str
     bookmaker_name: str
@@ -40,7 +40,7 @@ class OddsResult:
     bets: List[SingleBetOdds]
 
 
-@dataclass
+@dataclass(slots=True)
 class ValuePlay:
     event_id: str
     matchup: str
@@ -75,7 +75,7 @@ class ValuePlaysResult:
     plays: List[ValuePlay] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class BestValuePlay(ValuePlay):
     sport_key: str
     market: str
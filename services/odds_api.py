@@ -8,17 +8,23 @@ import re
 import threading
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import requests
 from fastapi import HTTPException
-from services.api_gateway import ApiGateway
+from services.api_gateway import ApiGateway, get_shared_http_session
 
 try:  # pragma: no cover - exercised in tests via fallback
     import aiohttp
 except ImportError:  # pragma: no cover - fallback when aiohttp is unavailable
     aiohttp = None
 
+try:  # pragma: no cover - optional fast JSON decoder
+    import orjson
+except ImportError:  # pragma: no cover - fallback to the stdlib decoder
+    orjson = None
+
+from utils.formatting import parse_iso_datetime
 from utils.logging_control import (
     TraceLevel,
     get_trace_level_from_env,
@@ -35,6 +41,9 @@ TRACE_LEVEL = get_trace_level_from_env()
 EVENT_ODDS_CONCURRENCY_LIMIT = 5
 RATE_LIMIT_MAX_ATTEMPTS = 3
 
+# Shared keep-alive session for direct (gateway-less) snapshot loader calls.
+_HTTP_SESSION = get_shared_http_session()
+
 
 class ApiCreditTracker:
     """Track SpotOddsAPI/The Odds API credit usage from response headers."""
@@ -120,6 +129,31 @@ def _log_api_response(endpoint: str, response: Any) -> None:
     )
 
 
+def _decode_json_response(response: Any) -> Any:
+    """Decode a JSON response body, using orjson when it is installed.
+
+    Odds payloads (events x bookmakers x markets x outcomes) run to hundreds of
+    KB, and orjson parses them several times faster than the stdlib decoder
+    while producing the same dict/list structure.
+    """
+
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _decode_json_text(body: str) -> Any:
+    """Decode an already-read JSON body (e.g. from aiohttp), preferring orjson.
+
+    ``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``, so callers
+    can keep catching the stdlib exception.
+    """
+
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
 def _format_provider_error_detail(response: requests.Response) -> str:
     """Return an error message that highlights possible credit usage issues."""
 
@@ -157,7 +191,7 @@ def _perform_get(
     if caller != "snapshot_loader":
         raise RuntimeError("Direct HTTP calls are blocked outside the snapshot loader")
 
-    return requests.get(url, params=params, timeout=timeout)
+    return _HTTP_SESSION.get(url, params=params, timeout=timeout)
 
 
 def _format_outcome_for_human_log(outcome: Dict[str, Any]) -> Optional[str]:
@@ -206,22 +240,27 @@ def build_human_readable_logs(
     for event in payload:
         home = event.get("home_team") or "Home"
         away = event.get("away_team") or "Away"
-        bookmakers = event.get("bookmakers", []) or []
+        teams = {home, away}
+
+        # Index each tracked book's markets once per event rather than rescanning
+        # them for every requested market; the first market listed under a key wins.
+        indexed_books: List[Tuple[Dict[str, Any], Dict[Any, Dict[str, Any]]]] = []
+        for bookmaker in event.get("bookmakers", []) or []:
+            book_key = bookmaker.get("key")
+            if book_key and bookmaker_keys and book_key not in bookmaker_keys:
+                continue
+            markets_by_key: Dict[Any, Dict[str, Any]] = {}
+            for market in bookmaker.get("markets", []):
+                markets_by_key.setdefault(market.get("key"), market)
+            indexed_books.append((bookmaker, markets_by_key))
 
         for market_key in market_list:
             book_names: List[str] = []
             summaries: List[str] = []
             participant_name: Optional[str] = None
 
-            for bookmaker in bookmakers:
-                book_key = bookmaker.get("key")
-                if book_key and bookmaker_keys and book_key not in bookmaker_keys:
-                    continue
-
-                market = next(
-                    (m for m in bookmaker.get("markets", []) if m.get("key") == market_key),
-                    None,
-                )
+            for bookmaker, markets_by_key in indexed_books:
+                market = markets_by_key.get(market_key)
                 if not market:
                     continue
 
@@ -229,7 +268,7 @@ def build_human_readable_logs(
                 prioritized = [
                     outcome
                     for outcome in outcomes
-                    if outcome.get("name") in {home, away}
+                    if outcome.get("name") in teams
                 ]
                 selected = prioritized if prioritized else outcomes
 
@@ -407,7 +446,7 @@ def fetch_odds(
             detail=_format_provider_error_detail(response),
         )
 
-    data: List[Dict[str, Any]] = response.json()
+    data: List[Dict[str, Any]] = _decode_json_response(response)
 
     # Persist real API output to a text file for later comparison to dummy data.
     _log_real_api_response(
@@ -454,7 +493,7 @@ def fetch_sport_events(
             detail=_format_provider_error_detail(response),
         )
 
-    return response.json()
+    return _decode_json_response(response)
 
 
 def _parse_datetime(timestamp: Optional[str]) -> Optional[datetime]:
@@ -464,7 +503,7 @@ def _parse_datetime(timestamp: Optional[str]) -> Optional[datetime]:
         return None
 
     try:
-        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        dt = parse_iso_datetime(timestamp)
     except Exception:
         return None
 
@@ -672,7 +711,7 @@ def fetch_player_props(
             ),
         )
 
-    events: List[Dict[str, Any]] = events_response.json()
+    events: List[Dict[str, Any]] = _decode_json_response(events_response)
     if team:
         team_lower = team.lower()
 
@@ -731,41 +770,25 @@ def fetch_player_props(
             "credit_tracker": credit_tracker,
         }
 
-        cache_args = (
-            api_key,
-            sport_key,
-            regions,
-            markets,
-            bookmaker_keys,
-            team,
-            player_name,
-            event_id,
-            use_dummy_data,
-            dummy_data_generator,
-            credit_tracker,
+        # cached_odds keys on every bound argument, so the keyword form matches
+        # however the original call was made.
+        cache_key = odds_cache_module._build_cache_key(
+            "fetch_player_props", tuple(), cache_kwargs
         )
+        cached_entry = odds_cache_module._CACHE.get(cache_key)
+        if not cached_entry:
+            return None
 
-        now = time.monotonic()
-        for key in (
-            odds_cache_module._build_cache_key("fetch_player_props", tuple(), cache_kwargs),
-            odds_cache_module._build_cache_key("fetch_player_props", cache_args, {}),
-        ):
-            cached_entry = odds_cache_module._CACHE.get(key)
-            if not cached_entry:
-                continue
-
-            expires_at, value = cached_entry
-            if value is None:
-                continue
-
-            if now > expires_at:
-                logger.warning(
-                    "Using expired cached player props after rate limit exhaustion for sport=%s",
-                    sport_key,
-                )
-            return value
+        expires_at, value = cached_entry
+        if value is None:
+            return None
 
-        return None
+        if time.monotonic() > expires_at:
+            logger.warning(
+                "Using expired cached player props after rate limit exhaustion for sport=%s",
+                sport_key,
+            )
+        return value
 
     odds_params = {
         "apiKey": api_key,
@@ -936,7 +959,7 @@ def fetch_player_props(
                     )
 
                 try:
-                    return json.loads(body)
+                    return _decode_json_text(body)
                 except json.JSONDecodeError:
                     logger.error(
                         "Failed to parse player props event response for event %s: %s",
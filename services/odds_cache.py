@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import inspect
+import threading
 import time
+from concurrent.futures import Future
 from functools import wraps
 from typing import Any, Callable, Dict, Hashable, Tuple
 
@@ -10,7 +13,15 @@ CacheKey = Tuple[Hashable, ...]
 CacheEntry = Tuple[float, Any]
 
 _CACHE: Dict[CacheKey, CacheEntry] = {}
-_SKIP_CACHE_KEYS = {"credit_tracker"}
+# Per-call bookkeeping and transport choices that do not change the payload.
+_SKIP_CACHE_KEYS = {"credit_tracker", "gateway", "gateway_caller"}
+# Expired entries are kept as a rate-limit fallback, so bound the cache by size.
+_MAX_CACHE_ENTRIES = 512
+_CACHE_LOCK = threading.Lock()
+
+# Calls currently fetching a given key; concurrent callers wait on the same future.
+_INFLIGHT: Dict[CacheKey, "Future[Any]"] = {}
+_INFLIGHT_LOCK = threading.Lock()
 
 
 def _freeze(value: Any) -> Hashable:
@@ -32,22 +43,46 @@ def _build_cache_key(func_name: str, args: Tuple[Any, ...], kwargs: Dict[str, An
     return (func_name, frozen_args, frozen_kwargs)
 
 
+def _store(cache_key: CacheKey, entry: CacheEntry) -> None:
+    """Insert ``entry`` and trim the cache back under ``_MAX_CACHE_ENTRIES``."""
+
+    with _CACHE_LOCK:
+        _CACHE[cache_key] = entry
+        if len(_CACHE) <= _MAX_CACHE_ENTRIES:
+            return
+
+        now = time.monotonic()
+        for key, (expires_at, _) in list(_CACHE.items()):
+            if expires_at <= now:
+                del _CACHE[key]
+        # Still full of live entries: drop the oldest insertions first.
+        while len(_CACHE) > _MAX_CACHE_ENTRIES:
+            del _CACHE[next(iter(_CACHE))]
+
+
 def clear_odds_cache() -> None:
-    """Reset all cached odds responses (useful in tests)."""
+    """Reset all cached odds responses (tests and manual invalidation)."""
 
-    _CACHE.clear()
+    with _CACHE_LOCK:
+        _CACHE.clear()
 
 
 def cached_odds(ttl: int) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Decorate a function to cache its result for ``ttl`` seconds."""
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(func)
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            if kwargs.get("use_dummy_data"):
+            # Bind to the signature so positional and keyword calls for the same
+            # request share one cache entry.
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if bound.arguments.get("use_dummy_data"):
                 return func(*args, **kwargs)
 
-            cache_key = _build_cache_key(func.__name__, args, kwargs)
+            cache_key = _build_cache_key(func.__name__, tuple(), bound.arguments)
             now = time.monotonic()
 
             cached = _CACHE.get(cache_key)
@@ -56,9 +91,32 @@ def cached_odds(ttl: int) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
                 if now < expires_at:
                     return value
 
-            result = func(*args, **kwargs)
-            _CACHE[cache_key] = (now + ttl, result)
-            return result
+            # Collapse identical concurrent fetches: the first caller performs the
+            # request and everyone else arriving meanwhile waits for its result.
+            with _INFLIGHT_LOCK:
+                pending = _INFLIGHT.get(cache_key)
+                if pending is None:
+                    pending = Future()
+                    _INFLIGHT[cache_key] = pending
+                    is_leader = True
+                else:
+                    is_leader = False
+
+            if not is_leader:
+                return pending.result()
+
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as exc:
+                pending.set_exception(exc)
+                raise
+            else:
+                _store(cache_key, (now + ttl, result))
+                pending.set_result(result)
+                return result
+            finally:
+                with _INFLIGHT_LOCK:
+                    _INFLIGHT.pop(cache_key, None)
 
         return wrapper
 
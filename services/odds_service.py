@@ -1,12 +1,16 @@
 """Services for odds fetching and transformation logic."""
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from services.domain import models
-from services.odds_utils import american_to_decimal, sanitize_american_price
+from services.odds_utils import sanitize_american_price
 from utils.formatting import pretty_book_label
 
+# Upper bound on concurrent per-sport fetches for a single /api/odds request.
+ODDS_FETCH_MAX_WORKERS = 4
+
 
 class OddsService:
     """Encapsulates odds retrieval and transformation for watcher bets."""
@@ -27,20 +31,22 @@ class OddsService:
         all_bets_results: List[Any] = []
         bets_by_sport = self._group_bets_by_sport(bets)
 
-        for sport_key, bets_for_sport in bets_by_sport.items():
-            markets = sorted({b.market for b in bets_for_sport})
-            bookmaker_keys = sorted({bk for b in bets_for_sport for bk in b.bookmaker_keys})
-
-            events = self._events_provider(
-                sport_key=sport_key,
-                markets=",".join(markets),
-                bookmaker_keys=bookmaker_keys,
-                category="odds",
-                use_dummy_data=use_dummy_data,
-                snapshot=snapshot,
+        def _fetch(item: Tuple[str, List[Any]]) -> List[Dict[str, Any]]:
+            return self._fetch_events_for_sport(
+                item[0], item[1], use_dummy_data=use_dummy_data, snapshot=snapshot
             )
 
-            self._data_validator(events, allow_dummy=use_dummy_data)
+        if len(bets_by_sport) > 1:
+            # Each sport is an independent upstream call; fetching them together
+            # makes the total wait roughly the slowest sport instead of the sum.
+            max_workers = min(ODDS_FETCH_MAX_WORKERS, len(bets_by_sport))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                events_per_sport = list(executor.map(_fetch, bets_by_sport.items()))
+        else:
+            events_per_sport = [_fetch(item) for item in bets_by_sport.items()]
+
+        for (sport_key, bets_for_sport), events in zip(bets_by_sport.items(), events_per_sport):
+            team_prices = self._index_team_prices(events)
 
             for bet in bets_for_sport:
                 prices_per_book: List[models.PriceQuote] = []
@@ -49,48 +55,18 @@ class OddsService:
                     price_for_team: Optional[int] = None
                     verified_from_api = False
 
-                    for event in events:
-                        home = event.get("home_team")
-                        away = event.get("away_team")
-
-                        if bet.team not in (home, away):
-                            continue
-
-                        book_market = None
-                        for bookmaker in event.get("bookmakers", []):
-                            if bookmaker.get("key") != book_key:
+                    for point, price in team_prices.get((bet.team, book_key, bet.market), ()):
+                        if bet.point is not None:
+                            if point is None:
                                 continue
-                            book_market = next(
-                                (m for m in bookmaker.get("markets", []) if m.get("key") == bet.market),
-                                None,
-                            )
-                            if book_market:
-                                break
-                        if not book_market:
-                            continue
-
-                        for outcome in book_market.get("outcomes", []):
-                            name = outcome.get("name")
-                            price = sanitize_american_price(outcome.get("price"))
-                            point = outcome.get("point", None)
-
-                            if name != bet.team:
-                                continue
-
-                            if bet.point is not None:
-                                if point is None:
-                                    continue
-                                if abs(point - bet.point) > 1e-6:
-                                    continue
-
-                            if price is None:
+                            if abs(point - bet.point) > 1e-6:
                                 continue
 
-                            price_for_team = price
-                            verified_from_api = not use_dummy_data
-                            break
+                        if price is None:
+                            continue
 
-                    if price_for_team is not None:
+                        price_for_team = price
+                        verified_from_api = not use_dummy_data
                         break
 
                     prices_per_book.append(
@@ -102,20 +78,6 @@ class OddsService:
                         )
                     )
 
-                valid_prices = [
-                    (bk, p)
-                    for bk, p in [(po.bookmaker_key, po.price) for po in prices_per_book]
-                    if p is not None
-                ]
-                best_price_for_team: Optional[int] = None
-                best_book: Optional[str] = None
-                if valid_prices:
-                    best_book, best_price_for_team = max(valid_prices, key=lambda x: american_to_decimal(x[1]))
-
-                for po in prices_per_book:
-                    if po.price is None and po.bookmaker_key == best_book:
-                        po.price = best_price_for_team
-
                 all_bets_results.append(
                     models.SingleBetOdds(
                         sport_key=sport_key,
@@ -128,6 +90,66 @@ class OddsService:
 
         return models.OddsResult(bets=all_bets_results)
 
+    def _fetch_events_for_sport(
+        self,
+        sport_key: str,
+        bets_for_sport: Sequence[Any],
+        *,
+        use_dummy_data: bool,
+        snapshot=None,
+    ) -> List[Dict[str, Any]]:
+        """Fetch and validate the events needed to price every bet for one sport."""
+
+        markets = sorted({b.market for b in bets_for_sport})
+        bookmaker_keys = sorted({bk for b in bets_for_sport for bk in b.bookmaker_keys})
+
+        events = self._events_provider(
+            sport_key=sport_key,
+            markets=",".join(markets),
+            bookmaker_keys=bookmaker_keys,
+            category="odds",
+            use_dummy_data=use_dummy_data,
+            snapshot=snapshot,
+        )
+
+        self._data_validator(events, allow_dummy=use_dummy_data)
+        return events
+
+    @staticmethod
+    def _index_team_prices(
+        events: Iterable[Dict[str, Any]],
+    ) -> Dict[Tuple[str, str, str], List[Tuple[Optional[float], Optional[int]]]]:
+        """Index ``(point, price)`` quotes by ``(team, bookmaker, market)`` in one pass.
+
+        Only outcomes naming one of the event's teams are kept. Quotes stay in
+        event/outcome order so the first acceptable one matches what a scan over
+        ``events`` would find. Like that scan, only the first bookmaker entry
+        carrying a market is used for each event.
+        """
+
+        index: Dict[Tuple[str, str, str], List[Tuple[Optional[float], Optional[int]]]] = {}
+        for event in events:
+            teams = (event.get("home_team"), event.get("away_team"))
+            seen_book_markets: set[Tuple[str, str]] = set()
+            for bookmaker in event.get("bookmakers", []):
+                book_key = bookmaker.get("key")
+                for market in bookmaker.get("markets", []):
+                    market_key = market.get("key")
+                    if (book_key, market_key) in seen_book_markets:
+                        continue
+                    seen_book_markets.add((book_key, market_key))
+                    for outcome in market.get("outcomes", []):
+                        name = outcome.get("name")
+                        if name not in teams:
+                            continue
+                        index.setdefault((name, book_key, market_key), []).append(
+                            (
+                                outcome.get("point", None),
+                                sanitize_american_price(outcome.get("price")),
+                            )
+                        )
+        return index
+
     @staticmethod
     def _collect_bookmaker_keys(bets: Sequence[Any]) -> set[str]:
         all_book_keys: set[str] = set()
@@ -1,6 +1,7 @@
 """Odds conversion and calculation utilities."""
 
-from typing import Optional
+from bisect import bisect_left
+from typing import Callable, Optional, Tuple
 
 MAX_VALID_AMERICAN_ODDS = 10000
 
@@ -21,14 +22,42 @@ def sanitize_american_price(price: Optional[int]) -> Optional[int]:
     return price
 
 
-def american_to_decimal(odds: int) -> float:
-    """Convert American odds to decimal odds."""
+def _american_to_decimal(odds: int) -> float:
     if odds > 0:
         return 1.0 + odds / 100.0
     else:
         return 1.0 + 100.0 / abs(odds)
 
 
+def _american_to_prob(odds: int) -> float:
+    if odds > 0:
+        return 100.0 / (odds + 100.0)
+    else:
+        return abs(odds) / (abs(odds) + 100.0)
+
+
+# Every sanitized price is an integer strictly inside +/-MAX_VALID_AMERICAN_ODDS,
+# so the conversions for that whole range are computed once at import time.
+_DECIMAL_BY_AMERICAN = {
+    odds: _american_to_decimal(odds)
+    for odds in range(-MAX_VALID_AMERICAN_ODDS + 1, MAX_VALID_AMERICAN_ODDS)
+    if odds != 0
+}
+_PROB_BY_AMERICAN = {
+    odds: _american_to_prob(odds)
+    for odds in range(-MAX_VALID_AMERICAN_ODDS + 1, MAX_VALID_AMERICAN_ODDS)
+    if odds != 0
+}
+
+
+def american_to_decimal(odds: int) -> float:
+    """Convert American odds to decimal odds."""
+    decimal = _DECIMAL_BY_AMERICAN.get(odds)
+    if decimal is None:
+        return _american_to_decimal(odds)
+    return decimal
+
+
 def decimal_to_american(decimal: float) -> int:
     """Convert decimal odds to American odds."""
     if decimal >= 2.0:
@@ -39,10 +68,10 @@ def decimal_to_american(decimal: float) -> int:
 
 def american_to_prob(odds: int) -> float:
     """Convert American odds to implied probability."""
-    if odds > 0:
-        return 100.0 / (odds + 100.0)
-    else:
-        return abs(odds) / (abs(odds) + 100.0)
+    prob = _PROB_BY_AMERICAN.get(odds)
+    if prob is None:
+        return _american_to_prob(odds)
+    return prob
 
 
 def estimate_ev_percent(book_odds: int, sharp_odds: int) -> float:
@@ -51,9 +80,13 @@ def estimate_ev_percent(book_odds: int, sharp_odds: int) -> float:
       EV% ~ (decimal_book * sharp_prob - 1) * 100
     where sharp_prob is implied probability from Novig, treated as "true".
     """
-    book_dec = american_to_decimal(book_odds)
+    return estimate_ev_percent_from_decimal(american_to_decimal(book_odds), sharp_odds)
+
+
+def estimate_ev_percent_from_decimal(book_decimal: float, sharp_odds: int) -> float:
+    """Same as :func:`estimate_ev_percent` for a book price already in decimal form."""
     sharp_prob = american_to_prob(sharp_odds)
-    ev = book_dec * sharp_prob - 1.0
+    ev = book_decimal * sharp_prob - 1.0
     return ev * 100.0
 
 
@@ -70,6 +103,25 @@ def is_price_or_better(current: int, target: int) -> bool:
     return current >= target
 
 
+def points_match_exact(book_point: float | None, novig_point: float | None) -> bool:
+    """Return True when both points are the same line (or both are None)."""
+    if book_point is None or novig_point is None:
+        return book_point is novig_point
+    return abs(book_point - novig_point) < 1e-9
+
+
+def points_match_within_half(book_point: float | None, novig_point: float | None) -> bool:
+    """Like :func:`points_match_exact` but also accepts lines up to 0.5 apart."""
+    if book_point is None or novig_point is None:
+        return book_point is novig_point
+    return abs(book_point - novig_point) <= 0.5 + 1e-9
+
+
+def points_matcher(allow_half_point_flex: bool) -> Callable[[float | None, float | None], bool]:
+    """Pick the point comparison once for a market instead of per outcome."""
+    return points_match_within_half if allow_half_point_flex else points_match_exact
+
+
 def points_match(
     book_point: float | None,
     novig_point: float | None,
@@ -82,17 +134,31 @@ def points_match(
     difference between Novig and the target book; when allow_half_point_flex
     is True we still consider those to be a match.
     """
-    if book_point is None or novig_point is None:
-        return book_point == novig_point
+    return points_matcher(allow_half_point_flex)(book_point, novig_point)
+
+
+_VIG_BY_BOOK = {
+    "fliff": 0.30,
+    "draftkings": 0.20,
+    "fanduel": 0.20,
+}
 
-    diff = abs(book_point - novig_point)
-    if diff < 1e-9:
-        return True
+# Ascending ladder of commonly posted prices that vig-adjusted odds snap down to.
+_COMMON_ODDS = (
+    -10000, -5000, -2500, -2000, -1500, -1200, -1000, -900, -800, -700, -600, -550,
+    -500, -475, -450, -425, -400, -375, -350, -325, -300, -275, -250, -225, -200,
+    -190, -180, -170, -160, -150, -140, -130, -120, -115, -110, -105, -102,
+    100, 102, 105, 110, 115, 120, 130, 140, 150, 160, 170, 180, 190,
+    200, 225, 250, 275, 300, 325, 350, 375, 400, 425, 450, 475, 500,
+    550, 600, 700, 800, 900, 1000, 1200, 1500, 2000, 2500, 5000, 10000,
+)
+_POSITIVE_COMMON_ODDS = tuple(x for x in _COMMON_ODDS if x > 0)
 
-    if allow_half_point_flex and diff <= 0.5 + 1e-9:
-        return True
 
-    return False
+def _largest_common_odds_below(ladder: Tuple[int, ...], limit: float) -> Optional[int]:
+    """Return the largest ladder price strictly below ``limit``, if any."""
+    idx = bisect_left(ladder, limit)
+    return ladder[idx - 1] if idx else None
 
 
 def apply_vig_adjustment(odds: int, bookmaker_key: str) -> int:
@@ -113,16 +179,17 @@ def apply_vig_adjustment(odds: int, bookmaker_key: str) -> int:
     if odds is None:
         return odds
 
-    vig_percentages = {
-        "fliff": 0.30,
-        "draftkings": 0.20,
-        "fanduel": 0.20,
-    }
-
-    vig_pct = vig_percentages.get(bookmaker_key.lower(), 0.0)
-    if vig_pct == 0.0:
+    book = bookmaker_key.lower()
+    table = _VIG_ADJUSTED_BY_BOOK.get(book)
+    if table is None:
         return odds
+    adjusted = table.get(odds)
+    if adjusted is None:
+        return _vig_adjusted_price(odds, _VIG_BY_BOOK[book])
+    return adjusted
+
 
+def _vig_adjusted_price(odds: int, vig_pct: float) -> int:
     dec_odds = american_to_decimal(odds)
     buffer = 0.01
     adjusted_dec = dec_odds * (1.0 - vig_pct - buffer)
@@ -134,46 +201,36 @@ def apply_vig_adjustment(odds: int, bookmaker_key: str) -> int:
         if adjusted_american >= odds:
             adjusted_american = max(100, odds - 50)
 
-    common_odds = [
-        -10000, -5000, -2500, -2000, -1500, -1200, -1000, -900, -800, -700, -600, -550,
-        -500, -475, -450, -425, -400, -375, -350, -325, -300, -275, -250, -225, -200,
-        -190, -180, -170, -160, -150, -140, -130, -120, -115, -110, -105, -102,
-        100, 102, 105, 110, 115, 120, 130, 140, 150, 160, 170, 180, 190,
-        200, 225, 250, 275, 300, 325, 350, 375, 400, 425, 450, 475, 500,
-        550, 600, 700, 800, 900, 1000, 1200, 1500, 2000, 2500, 5000, 10000
-    ]
-
     if odds > 0:
-        positive_common_odds = [x for x in common_odds if x > 0]
-        worse_options = [x for x in positive_common_odds if x < adjusted_american and x < odds]
-        if worse_options:
-            closest = max(worse_options)
-        else:
+        closest = _largest_common_odds_below(
+            _POSITIVE_COMMON_ODDS, min(adjusted_american, odds)
+        )
+        if closest is None:
             closest = max(100, int(adjusted_american))
             if closest >= odds:
-                worse_values = [x for x in positive_common_odds if x < odds]
-                if worse_values:
-                    closest = max(worse_values)
-                else:
+                closest = _largest_common_odds_below(_POSITIVE_COMMON_ODDS, odds)
+                if closest is None:
                     closest = max(100, odds - 50)
         return closest
     else:
-        worse_options = [x for x in common_odds if x < adjusted_american and x < odds]
-        if worse_options:
-            closest = max(worse_options)
-        else:
+        closest = _largest_common_odds_below(_COMMON_ODDS, min(adjusted_american, odds))
+        if closest is None:
             closest = int(adjusted_american)
             if closest >= odds:
-                worse_values = [x for x in common_odds if x < odds]
-                if worse_values:
-                    closest = max(worse_values)
-                else:
+                closest = _largest_common_odds_below(_COMMON_ODDS, odds)
+                if closest is None:
                     closest = odds - 10
         return closest
 
 
-
-
-
-
-
+# Per-book adjusted price for every sanitized American price, computed once at
+# import time like the conversion tables above.
+_VIG_ADJUSTED_BY_BOOK = {
+    book: {
+        odds: _vig_adjusted_price(odds, vig_pct)
+        for odds in range(-MAX_VALID_AMERICAN_ODDS + 1, MAX_VALID_AMERICAN_ODDS)
+        if odds != 0
+    }
+    for book, vig_pct in _VIG_BY_BOOK.items()
+    if vig_pct != 0.0
+}
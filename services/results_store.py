@@ -1,7 +1,10 @@
 """In-memory cache for computed analytics derived from a snapshot."""
 from __future__ import annotations
 
-from typing import Any, Dict, Hashable, Optional, Tuple
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
 
 from services.snapshot import OddsSnapshot
 
@@ -46,3 +49,67 @@ class ResultsStore:
         snapshot to their callbacks.
         """
         self._store.clear()
+
+
+class LiveResultCache:
+    """Cache computed results for a short TTL when there is no snapshot to version by.
+
+    Used in on-demand mode. Identical concurrent requests share one build. The
+    store is kept apart from the upstream odds cache so computed responses never
+    take its slots or trigger the trims that drop its stale fallback entries.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 64) -> None:
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._store: Dict[Tuple[str, Hashable], Tuple[float, Any]] = {}
+        self._inflight: Dict[Tuple[str, Hashable], "Future[Any]"] = {}
+        self._lock = threading.Lock()
+
+    def get_or_build(
+        self, *, scope: str, params: Dict[str, Any], build: Callable[[], Any]
+    ) -> Any:
+        key = (scope, _normalize_value(params))
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                return entry[1]
+            pending = self._inflight.get(key)
+            is_leader = pending is None
+            if is_leader:
+                pending = Future()
+                self._inflight[key] = pending
+
+        if not is_leader:
+            return pending.result()
+
+        try:
+            value = build()
+        except BaseException as exc:
+            with self._lock:
+                self._inflight.pop(key, None)
+            pending.set_exception(exc)
+            raise
+
+        with self._lock:
+            self._store[key] = (time.monotonic() + self._ttl, value)
+            self._trim()
+            self._inflight.pop(key, None)
+        pending.set_result(value)
+        return value
+
+    def _trim(self) -> None:
+        """Drop expired entries, then the oldest ones, once over ``max_entries``."""
+
+        if len(self._store) <= self._max_entries:
+            return
+        now = time.monotonic()
+        for key, (expires_at, _) in list(self._store.items()):
+            if expires_at <= now:
+                del self._store[key]
+        while len(self._store) > self._max_entries:
+            del self._store[next(iter(self._store))]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
@@ -1,16 +1,36 @@
 """Services encapsulating value play calculations."""
 from __future__ import annotations
 
+import heapq
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Callable, Iterable, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+from services.api_gateway import GATEWAY_MAX_CONCURRENCY
 from services.domain import models
 from services.player_props_config import expand_player_prop_markets, is_player_prop_market
-from utils.formatting import format_start_time_est
+from utils.formatting import format_datetime_est, parse_iso_datetime
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent sport/market fetches for best-value sweeps. Live
+# fetches all pass through the shared ApiGateway, so more workers than it lets
+# through would only queue on its semaphore.
+BEST_VALUE_MAX_WORKERS = GATEWAY_MAX_CONCURRENCY
+
+
+def _hedge_sort_key(play) -> float:
+    """Rank plays by arb margin, then hedge EV, then raw EV as a last resort."""
+
+    if getattr(play, "arb_margin_percent", None) is not None:
+        return play.arb_margin_percent
+    hedge_ev = getattr(play, "hedge_ev_percent", None)
+    ev_percent = getattr(play, "ev_percent", 0)
+    if hedge_ev is not None:
+        return hedge_ev
+    return -1_000_000.0 + ev_percent
+
 
 class ValuePlayService:
     """Handle value play and best-value-play orchestration."""
@@ -64,14 +84,10 @@ class ValuePlayService:
             for play in raw_plays_dto
         ]
 
-        filtered_plays = self._filter_future_events(raw_plays)
-        self._format_start_times(filtered_plays)
-
-        top_plays = self._sort_by_hedge(filtered_plays)
+        filtered_plays = self._keep_future_plays_with_display_times(raw_plays)
 
         max_results = getattr(payload, "max_results", None)
-        if max_results is not None and max_results > 0:
-            top_plays = top_plays[:max_results]
+        top_plays = self._sort_by_hedge(filtered_plays, limit=max_results)
 
         return models.ValuePlaysResult(
             target_book=payload.target_book,
@@ -85,91 +101,36 @@ class ValuePlayService:
     ) -> models.BestValuePlaysResult:
         all_plays: List[Any] = []
 
-        for sport_key in payload.sport_keys:
-            for market_key in payload.markets:
-                expanded_markets = self._expand_market_keys_for_sport(sport_key, market_key)
-                if not expanded_markets:
-                    continue
-
-                try:
-                    events = self._events_provider(
-                        sport_key=sport_key,
-                        markets=expanded_markets,
-                        bookmaker_keys=[payload.target_book, payload.compare_book],
-                        category="player_props"
-                        if any(is_player_prop_market(m) for m in expanded_markets)
-                        else "odds",
-                        use_dummy_data=use_dummy_data,
-                        snapshot=snapshot,
-                    )
-
-                    self._data_validator(events, allow_dummy=use_dummy_data)
-
-                    for normalized_market in expanded_markets:
-                        raw_plays_dto = self._collect_value_plays(
-                            events, normalized_market, payload.target_book, payload.compare_book
-                        )
+        # Repeated sports or markets in the request would fetch the same data and
+        # report every play twice, so each pair is swept once (first-seen order).
+        combos = list(
+            dict.fromkeys(
+                (sport_key, market_key)
+                for sport_key in payload.sport_keys
+                for market_key in payload.markets
+            )
+        )
 
-                        filtered_plays = self._filter_future_events(
-                            [
-                                models.ValuePlay(
-                                    event_id=play.event_id,
-                                    matchup=play.matchup,
-                                    start_time=play.start_time,
-                                    outcome_name=play.outcome_name,
-                                    point=play.point,
-                                    market=getattr(play, "market", normalized_market),
-                                    novig_price=play.novig_price,
-                                    novig_reverse_name=play.novig_reverse_name,
-                                    novig_reverse_price=play.novig_reverse_price,
-                                    book_price=play.book_price,
-                                    ev_percent=play.ev_percent,
-                                    hedge_ev_percent=getattr(play, "hedge_ev_percent", None),
-                                    is_arbitrage=getattr(play, "is_arbitrage", False),
-                                    arb_margin_percent=getattr(play, "arb_margin_percent", None),
-                                )
-                                for play in raw_plays_dto
-                            ]
-                        )
+        def _collect(combo: Tuple[str, str]) -> List[Any]:
+            return self._collect_best_value_plays_for(
+                combo[0], combo[1], payload, use_dummy_data, snapshot
+            )
 
-                        for play in filtered_plays:
-                            formatted_time = play.start_time
-                            if formatted_time and formatted_time.strip():
-                                try:
-                                    formatted_time = format_start_time_est(formatted_time)
-                                except Exception:
-                                    formatted_time = play.start_time or "—"
-                            else:
-                                formatted_time = "—"
-
-                            all_plays.append(
-                                models.BestValuePlay(
-                                    sport_key=sport_key,
-                                    market=getattr(play, "market", normalized_market),
-                                    event_id=play.event_id,
-                                    matchup=play.matchup,
-                                    start_time=formatted_time,
-                                    outcome_name=play.outcome_name,
-                                    point=play.point,
-                                    novig_price=play.novig_price,
-                                    novig_reverse_name=play.novig_reverse_name,
-                                    novig_reverse_price=play.novig_reverse_price,
-                                    book_price=play.book_price,
-                                    ev_percent=play.ev_percent,
-                                    hedge_ev_percent=play.hedge_ev_percent,
-                                    is_arbitrage=play.is_arbitrage,
-                                    arb_margin_percent=play.arb_margin_percent,
-                                )
-                            )
-                except Exception:
-                    logger.exception("Error processing %s/%s", sport_key, market_key)
-                    continue
+        if len(combos) > 1:
+            # Live fetches per sport/market are I/O bound, so a small pool turns the
+            # total latency into roughly the slowest call. ``map`` keeps submission
+            # order so hedge ties still resolve the same way as the serial loop.
+            max_workers = min(BEST_VALUE_MAX_WORKERS, len(combos))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_collect, combos))
+        else:
+            results = [_collect(combo) for combo in combos]
 
-        top_plays = self._sort_by_hedge(all_plays)
+        for plays in results:
+            all_plays.extend(plays)
 
         max_results = payload.max_results or 50
-        if max_results > 0:
-            top_plays = top_plays[:max_results]
+        top_plays = self._sort_by_hedge(all_plays, limit=max_results)
 
         return models.BestValuePlaysResult(
             target_book=payload.target_book,
@@ -178,6 +139,95 @@ class ValuePlayService:
             used_dummy_data=use_dummy_data,
         )
 
+    def _collect_best_value_plays_for(
+        self,
+        sport_key: str,
+        market_key: str,
+        payload: models.BestValuePlaysQuery,
+        use_dummy_data: bool,
+        snapshot=None,
+    ) -> List[Any]:
+        """Return formatted best-value plays for a single sport/market pair."""
+
+        plays: List[Any] = []
+        expanded_markets = self._expand_market_keys_for_sport(sport_key, market_key)
+        if not expanded_markets:
+            return plays
+
+        try:
+            events = self._events_provider(
+                sport_key=sport_key,
+                markets=expanded_markets,
+                bookmaker_keys=[payload.target_book, payload.compare_book],
+                category="player_props"
+                if any(is_player_prop_market(m) for m in expanded_markets)
+                else "odds",
+                use_dummy_data=use_dummy_data,
+                snapshot=snapshot,
+            )
+
+            self._data_validator(events, allow_dummy=use_dummy_data)
+
+            for normalized_market in expanded_markets:
+                raw_plays_dto = self._collect_value_plays(
+                    events, normalized_market, payload.target_book, payload.compare_book
+                )
+
+                filtered_plays = self._keep_future_plays_with_display_times(
+                    [
+                        models.ValuePlay(
+                            event_id=play.event_id,
+                            matchup=play.matchup,
+                            start_time=play.start_time,
+                            outcome_name=play.outcome_name,
+                            point=play.point,
+                            market=getattr(play, "market", normalized_market),
+                            novig_price=play.novig_price,
+                            novig_reverse_name=play.novig_reverse_name,
+                            novig_reverse_price=play.novig_reverse_price,
+                            book_price=play.book_price,
+                            ev_percent=play.ev_percent,
+                            hedge_ev_percent=getattr(play, "hedge_ev_percent", None),
+                            is_arbitrage=getattr(play, "is_arbitrage", False),
+                            arb_margin_percent=getattr(play, "arb_margin_percent", None),
+                        )
+                        for play in raw_plays_dto
+                    ]
+                )
+
+                for play in filtered_plays:
+                    plays.append(
+                        models.BestValuePlay(
+                            sport_key=sport_key,
+                            market=getattr(play, "market", normalized_market),
+                            event_id=play.event_id,
+                            matchup=play.matchup,
+                            start_time=play.start_time,
+                            outcome_name=play.outcome_name,
+                            point=play.point,
+                            novig_price=play.novig_price,
+                            novig_reverse_name=play.novig_reverse_name,
+                            novig_reverse_price=play.novig_reverse_price,
+                            book_price=play.book_price,
+                            ev_percent=play.ev_percent,
+                            hedge_ev_percent=play.hedge_ev_percent,
+                            is_arbitrage=play.is_arbitrage,
+                            arb_margin_percent=play.arb_margin_percent,
+                        )
+                    )
+        except Exception as exc:
+            # One line per failed combo keeps rate-limited or unsupported sweeps from
+            # flooding the log; the traceback is only attached at debug level.
+            logger.warning(
+                "Error processing %s/%s: %s",
+                sport_key,
+                market_key,
+                exc,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+
+        return plays
+
     @staticmethod
     def _expand_market_keys_for_sport(sport_key: str, market_key: str) -> List[str]:
         """Normalize a market key and expand player-prop aliases for a sport."""
@@ -192,40 +242,47 @@ class ValuePlayService:
         return [trimmed] if trimmed else []
 
     @staticmethod
-    def _sort_by_hedge(plays: Iterable[Any]) -> List[Any]:
-        def hedge_sort_key(play) -> float:
-            if getattr(play, "arb_margin_percent", None) is not None:
-                return play.arb_margin_percent
-            hedge_ev = getattr(play, "hedge_ev_percent", None)
-            ev_percent = getattr(play, "ev_percent", 0)
-            if hedge_ev is not None:
-                return hedge_ev
-            return -1_000_000.0 + ev_percent
-
-        return sorted(plays, key=hedge_sort_key, reverse=True)
+    def _sort_by_hedge(plays: Iterable[Any], limit: Optional[int] = None) -> List[Any]:
+        """Return plays ordered by hedge opportunity, keeping only the top ``limit``.
+
+        ``heapq.nlargest`` keeps the selection at O(N log K) when only the first
+        ``limit`` plays are returned, and matches ``sorted(..., reverse=True)[:limit]``
+        ordering (including ties).
+        """
+
+        if limit is not None and limit > 0:
+            return heapq.nlargest(limit, plays, key=_hedge_sort_key)
+        return sorted(plays, key=_hedge_sort_key, reverse=True)
 
     @staticmethod
-    def _filter_future_events(plays: Iterable[Any]) -> List[Any]:
+    def _keep_future_plays_with_display_times(plays: Iterable[Any]) -> List[Any]:
+        """Drop plays that have started and swap ``start_time`` for its ET label.
+
+        Filtering and formatting share one pass: every outcome of an event carries
+        the same start time, so each distinct timestamp string is parsed and
+        formatted once per call instead of once per play.
+        """
+
         now_utc = datetime.now(timezone.utc)
-        filtered: List[Any] = []
+        # None marks a start time that is in the past or could not be parsed.
+        label_by_start: Dict[str, Optional[str]] = {}
+        kept: List[Any] = []
         for play in plays:
             start_time = getattr(play, "start_time", None)
             if not start_time:
                 continue
-            try:
-                dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-                if dt > now_utc:
-                    filtered.append(play)
-            except Exception:
-                continue
-        return filtered
-
-    @staticmethod
-    def _format_start_times(plays: Iterable[Any]) -> None:
-        for play in plays:
-            start_time = getattr(play, "start_time", None)
-            if start_time:
+            if start_time not in label_by_start:
+                label: Optional[str] = None
                 try:
-                    play.start_time = format_start_time_est(start_time)
+                    dt = parse_iso_datetime(start_time)
+                    if dt > now_utc:
+                        label = format_datetime_est(dt)
                 except Exception:
-                    play.start_time = start_time
+                    label = None
+                label_by_start[start_time] = label
+            label = label_by_start[start_time]
+            if label is None:
+                continue
+            play.start_time = label
+            kept.append(play)
+        return kept
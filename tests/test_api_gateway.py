@@ -0,0 +1,36 @@
+import threading
+import time
+
+from services.api_gateway import ApiGateway
+
+
+class _RecordingSession:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def get(self, url, params=None, timeout=None):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        return url
+
+
+def test_gateway_overlaps_calls_up_to_its_concurrency_cap():
+    session = _RecordingSession()
+    gateway = ApiGateway(session=session, max_concurrency=2)
+
+    threads = [
+        threading.Thread(target=gateway.get, args=(f"https://example.test/{i}", {}), kwargs={"caller": "on_demand_api"})
+        for i in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert session.peak == 2
@@ -106,3 +106,147 @@ def test_best_value_filters_out_unsupported_nhl_player_props():
     assert "player_total_saves" in {play.market for play in result.plays}
     assert "player_saves" not in {play.market for play in result.plays}
     assert {play.market for play in result.plays} == set(expected_markets)
+
+
+def test_best_value_returns_top_hedge_plays_in_order():
+    future_start = (datetime.now(timezone.utc) + timedelta(hours=2)).isoformat().replace("+00:00", "Z")
+    margins = [0.5, -2.0, 3.0, None, 1.0, 3.0]
+
+    def provider(**kwargs):
+        return [{"id": "event-1"}]
+
+    def noop_validator(events, allow_dummy):
+        return None
+
+    def stub_collect(events, market_key, target_book, compare_book):
+        return [
+            models.ValuePlay(
+                event_id=f"event-{idx}",
+                matchup="Team A vs Team B",
+                start_time=future_start,
+                outcome_name="Team A",
+                point=None,
+                market=market_key,
+                novig_price=100,
+                novig_reverse_name="Team B",
+                novig_reverse_price=-110,
+                book_price=-105,
+                ev_percent=1.0,
+                hedge_ev_percent=None,
+                is_arbitrage=False,
+                arb_margin_percent=margin,
+            )
+            for idx, margin in enumerate(margins)
+        ]
+
+    service = ValuePlayService(provider, noop_validator, stub_collect)
+    query = models.BestValuePlaysQuery(
+        sport_keys=["basketball_nba"],
+        markets=["h2h"],
+        target_book="draftkings",
+        compare_book="novig",
+        max_results=3,
+    )
+
+    result = service.get_best_value_plays(query, use_dummy_data=False)
+
+    assert [play.event_id for play in result.plays] == ["event-2", "event-5", "event-4"]
+
+
+def test_best_value_fans_out_across_sports_and_skips_failures():
+    future_start = (datetime.now(timezone.utc) + timedelta(hours=2)).isoformat().replace("+00:00", "Z")
+
+    def provider(**kwargs):
+        if kwargs["sport_key"] == "icehockey_nhl":
+            raise RuntimeError("upstream unavailable")
+        return [{"id": kwargs["sport_key"]}]
+
+    def noop_validator(events, allow_dummy):
+        return None
+
+    def stub_collect(events, market_key, target_book, compare_book):
+        return [
+            models.ValuePlay(
+                event_id=f"{events[0]['id']}-{market_key}",
+                matchup="Team A vs Team B",
+                start_time=future_start,
+                outcome_name="Team A",
+                point=None,
+                market=market_key,
+                novig_price=100,
+                novig_reverse_name="Team B",
+                novig_reverse_price=-110,
+                book_price=-105,
+                ev_percent=1.0,
+                hedge_ev_percent=None,
+                is_arbitrage=False,
+                arb_margin_percent=1.0,
+            )
+        ]
+
+    service = ValuePlayService(provider, noop_validator, stub_collect)
+    query = models.BestValuePlaysQuery(
+        sport_keys=["basketball_nba", "icehockey_nhl", "baseball_mlb"],
+        markets=["h2h", "totals"],
+        target_book="draftkings",
+        compare_book="novig",
+        max_results=None,
+    )
+
+    result = service.get_best_value_plays(query, use_dummy_data=False)
+
+    assert [play.event_id for play in result.plays] == [
+        "basketball_nba-h2h",
+        "basketball_nba-totals",
+        "baseball_mlb-h2h",
+        "baseball_mlb-totals",
+    ]
+
+
+def test_best_value_sweeps_repeated_sport_market_pairs_once():
+    future_start = (datetime.now(timezone.utc) + timedelta(hours=2)).isoformat().replace("+00:00", "Z")
+    calls = []
+
+    def provider(**kwargs):
+        calls.append((kwargs["sport_key"], kwargs["markets"]))
+        return [{"id": kwargs["sport_key"]}]
+
+    def noop_validator(events, allow_dummy):
+        return None
+
+    def stub_collect(events, market_key, target_book, compare_book):
+        return [
+            models.ValuePlay(
+                event_id=f"{events[0]['id']}-{market_key}",
+                matchup="Team A vs Team B",
+                start_time=future_start,
+                outcome_name="Team A",
+                point=None,
+                market=market_key,
+                novig_price=100,
+                novig_reverse_name="Team B",
+                novig_reverse_price=-110,
+                book_price=-105,
+                ev_percent=1.0,
+                hedge_ev_percent=None,
+                is_arbitrage=False,
+                arb_margin_percent=1.0,
+            )
+        ]
+
+    service = ValuePlayService(provider, noop_validator, stub_collect)
+    query = models.BestValuePlaysQuery(
+        sport_keys=["basketball_nba", "basketball_nba"],
+        markets=["h2h", "totals", "h2h"],
+        target_book="draftkings",
+        compare_book="novig",
+        max_results=None,
+    )
+
+    result = service.get_best_value_plays(query, use_dummy_data=False)
+
+    assert sorted(calls) == [("basketball_nba", ["h2h"]), ("basketball_nba", ["totals"])]
+    assert [play.event_id for play in result.plays] == [
+        "basketball_nba-h2h",
+        "basketball_nba-totals",
+    ]
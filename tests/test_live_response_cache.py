@@ -0,0 +1,45 @@
+import pytest
+
+import main
+from services.odds_cache import clear_odds_cache
+
+
+@pytest.fixture
+def live_build():
+    """Yield a value-plays payload and a build callback that returns its call count."""
+
+    main.live_results.clear()
+    payload = main.ValuePlaysRequest(
+        sport_key="basketball_nba", target_book="fliff", compare_book="novig", market="h2h"
+    )
+    builds = []
+
+    def build():
+        builds.append(1)
+        return len(builds)
+
+    yield payload, build
+    main.live_results.clear()
+
+
+def test_live_responses_are_reused_within_ttl_but_dummy_data_is_rebuilt(live_build):
+    payload, build = live_build
+
+    assert main._snapshot_cached_response("value-plays", payload, None, build) == 1
+    # Live responses live outside the upstream odds cache.
+    clear_odds_cache()
+    assert main._snapshot_cached_response("value-plays", payload, None, build) == 1
+    assert (
+        main._snapshot_cached_response(
+            "value-plays", payload, None, build, use_dummy_data=True
+        )
+        == 2
+    )
+
+
+def test_cache_invalidate_rebuilds_next_live_response(live_build):
+    payload, build = live_build
+
+    assert main._snapshot_cached_response("value-plays", payload, None, build) == 1
+    assert main.invalidate_caches() == {"status": "ok"}
+    assert main._snapshot_cached_response("value-plays", payload, None, build) == 2
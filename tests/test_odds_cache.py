@@ -1,5 +1,7 @@
+import threading
 import time
 
+from services import odds_cache
 from services.odds_cache import cached_odds, clear_odds_cache
 
 
@@ -56,3 +58,62 @@ def test_cached_odds_skips_dummy_data_requests() -> None:
     assert first["call"] == 1
     assert second["call"] == 2
 
+
+def test_cached_odds_collapses_concurrent_identical_calls() -> None:
+    call_count = 0
+    started = threading.Event()
+    release = threading.Event()
+
+    @cached_odds(ttl=60)
+    def fetch_data(*, value: int, use_dummy_data: bool = False) -> dict:
+        nonlocal call_count
+        call_count += 1
+        started.set()
+        release.wait(timeout=5)
+        return {"value": value, "call": call_count}
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(fetch_data(value=4)))
+    leader.start()
+    started.wait(timeout=5)
+    followers = [
+        threading.Thread(target=lambda: results.append(fetch_data(value=4)))
+        for _ in range(3)
+    ]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(timeout=5)
+
+    assert call_count == 1
+    assert results == [{"value": 4, "call": 1}] * 4
+
+
+def test_cached_odds_shares_entry_between_positional_and_keyword_calls() -> None:
+    call_count = 0
+
+    @cached_odds(ttl=60)
+    def fetch_data(sport_key: str, markets: str, use_dummy_data: bool = False, gateway=None) -> dict:
+        nonlocal call_count
+        call_count += 1
+        return {"sport_key": sport_key, "markets": markets}
+
+    fetch_data("basketball_nba", "h2h")
+    fetch_data(sport_key="basketball_nba", markets="h2h", gateway=object())
+
+    assert call_count == 1
+
+
+def test_cached_odds_trims_cache_to_max_entries(monkeypatch) -> None:
+    monkeypatch.setattr(odds_cache, "_MAX_CACHE_ENTRIES", 3)
+
+    @cached_odds(ttl=60)
+    def fetch_data(*, value: int, use_dummy_data: bool = False) -> int:
+        return value
+
+    for value in range(5):
+        fetch_data(value=value)
+
+    assert len(odds_cache._CACHE) == 3
@@ -0,0 +1,91 @@
+from services.domain import models
+from services.odds_service import OddsService
+
+
+def _events():
+    return [
+        {
+            "id": "event-1",
+            "home_team": "Home Team",
+            "away_team": "Away Team",
+            "commence_time": "2099-01-01T00:00:00Z",
+            "bookmakers": [
+                {
+                    "key": "draftkings",
+                    "markets": [
+                        {
+                            "key": "spreads",
+                            "outcomes": [
+                                {"name": "Home Team", "price": -110, "point": -3.5},
+                                {"name": "Away Team", "price": -110, "point": 3.5},
+                            ],
+                        }
+                    ],
+                },
+                {
+                    "key": "fanduel",
+                    "markets": [
+                        {
+                            "key": "spreads",
+                            "outcomes": [
+                                {"name": "Home Team", "price": -105, "point": -4.5},
+                                {"name": "Away Team", "price": -115, "point": 4.5},
+                            ],
+                        }
+                    ],
+                },
+            ],
+        }
+    ]
+
+
+def test_get_odds_reports_price_for_every_requested_book():
+    service = OddsService(
+        events_provider=lambda **_: _events(),
+        data_validator=lambda events, allow_dummy: None,
+    )
+    bet = models.Bet(
+        sport_key="basketball_nba",
+        market="spreads",
+        team="Home Team",
+        point=-3.5,
+        bookmaker_keys=["draftkings", "fanduel", "novig"],
+    )
+
+    result = service.get_odds([bet], use_dummy_data=False)
+
+    prices = {quote.bookmaker_key: quote.price for quote in result.bets[0].prices}
+    assert prices == {"draftkings": -110, "fanduel": None, "novig": None}
+    verified = {quote.bookmaker_key: quote.verified_from_api for quote in result.bets[0].prices}
+    assert verified["draftkings"] is True
+
+
+def test_get_odds_fetches_each_sport_and_keeps_request_order():
+    calls = []
+
+    def provider(*, sport_key, **_):
+        calls.append(sport_key)
+        events = _events()
+        events[0]["sport_key"] = sport_key
+        return events
+
+    service = OddsService(
+        events_provider=provider,
+        data_validator=lambda events, allow_dummy: None,
+    )
+    bets = [
+        models.Bet(
+            sport_key=sport_key,
+            market="spreads",
+            team="Home Team",
+            point=-3.5,
+            bookmaker_keys=["draftkings"],
+        )
+        for sport_key in ("basketball_nba", "americanfootball_nfl", "icehockey_nhl")
+    ]
+
+    result = service.get_odds(bets, use_dummy_data=False)
+
+    assert sorted(calls) == sorted(bet.sport_key for bet in bets)
+    assert [b.sport_key for b in result.bets] == [bet.sport_key for bet in bets]
+    assert all(b.prices[0].price == -110 for b in result.bets)
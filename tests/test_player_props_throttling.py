@@ -13,6 +13,7 @@ class FakeResponse:
     def __init__(self, status_code: int, text: str, headers: Optional[Dict[str, str]] = None):
         self.status_code = status_code
         self.text = text
+        self.content = text.encode("utf-8")
         self.headers = headers or {}
 
     def json(self) -> Any:
@@ -60,7 +61,7 @@ def test_fetch_player_props_retries_on_rate_limit(monkeypatch, caplog):
         sleep_calls.append(delay)
 
     monkeypatch.setattr(odds_api, "aiohttp", None)
-    monkeypatch.setattr(odds_api.requests, "get", fake_requests_get)
+    monkeypatch.setattr(odds_api._HTTP_SESSION, "get", fake_requests_get)
     monkeypatch.setattr(odds_api.asyncio, "sleep", fake_sleep)
 
     result = odds_api.fetch_player_props(
@@ -114,7 +115,7 @@ def test_fetch_player_props_falls_back_after_persistent_rate_limits(monkeypatch,
         return None
 
     monkeypatch.setattr(odds_api, "aiohttp", None)
-    monkeypatch.setattr(odds_api.requests, "get", fake_requests_get)
+    monkeypatch.setattr(odds_api._HTTP_SESSION, "get", fake_requests_get)
     monkeypatch.setattr(odds_api.asyncio, "sleep", fake_sleep)
     monkeypatch.setattr(odds_api, "fetch_odds", fake_fetch_odds)
 
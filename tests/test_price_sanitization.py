@@ -1,6 +1,11 @@
 from bet_watcher import extract_team_prices
 from main import _extract_line_tracker_markets
-from services.odds_utils import sanitize_american_price
+from services.odds_utils import (
+    american_to_decimal,
+    american_to_prob,
+    apply_vig_adjustment,
+    sanitize_american_price,
+)
 
 
 def test_sanitize_extreme_price_returns_none():
@@ -9,6 +14,24 @@ def test_sanitize_extreme_price_returns_none():
     assert sanitize_american_price(150) == 150
 
 
+def test_vig_adjustment_snaps_to_next_worse_common_price():
+    assert apply_vig_adjustment(300, "DraftKings") == 200
+    assert apply_vig_adjustment(1000, "draftkings") == 700
+    assert apply_vig_adjustment(-110, "fliff") == -325
+    # Nothing on the ladder is worse than -10000, so fall back to a fixed step.
+    assert apply_vig_adjustment(-10000, "draftkings") == -10010
+    assert apply_vig_adjustment(-110, "novig") == -110
+
+
+def test_odds_conversions_cover_table_and_out_of_range_prices():
+    assert american_to_decimal(-110) == 1.0 + 100.0 / 110
+    assert american_to_decimal(150) == 2.5
+    assert american_to_prob(-110) == 110 / 210.0
+    # Prices outside the precomputed table still convert via the formula.
+    assert american_to_decimal(25000) == 251.0
+    assert american_to_prob(-25000) == 25000 / 25100.0
+
+
 def test_line_tracker_ignores_extreme_prices():
     event = {
         "home_team": "Home Team",
@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta, timezone
 
-from main import collect_value_plays
+from main import collect_value_plays, find_best_comparison_outcome, outcome_columns
 
 
 def test_moneyline_skips_when_target_book_has_no_posted_prices():
@@ -135,3 +135,66 @@ def test_skips_when_compare_book_lacks_opposite_side():
     plays = collect_value_plays(events, market_key="h2h", target_book="draftkings", compare_book="novig")
 
     assert plays == []
+
+
+def test_find_best_comparison_outcome_prefers_exact_point_with_columns():
+    outcomes = [
+        {"name": "Over", "price": -105, "point": 220.0},
+        {"name": "Under", "price": -115, "point": 220.5},
+        {"name": "Over", "price": -110, "point": 220.5},
+    ]
+    columns = outcome_columns(outcomes)
+
+    same_side = find_best_comparison_outcome(
+        outcomes=outcomes,
+        name="Over",
+        point=220.5,
+        allow_half_point_flex=True,
+        columns=columns,
+    )
+    opposite_side = find_best_comparison_outcome(
+        outcomes=outcomes, name="Over", point=220.5, allow_half_point_flex=True, opposite=True
+    )
+
+    assert same_side is outcomes[2]
+    assert opposite_side is outcomes[1]
+
+
+
+def test_find_best_comparison_outcome_opposite_flex_prefers_earliest_exact_line():
+    outcomes = [
+        {"name": "Team A", "price": -110, "point": 3.5},
+        {"name": "Team B", "price": -105, "point": 3.0},
+        {"name": "Team C", "price": -110, "point": 3.25},
+        {"name": "Team D", "price": -115, "point": 3.5},
+        {"name": "Team B", "price": -120, "point": 3.5},
+    ]
+
+    match = find_best_comparison_outcome(
+        outcomes=outcomes, name="Team A", point=3.5, allow_half_point_flex=True, opposite=True
+    )
+
+    # A later exact line beats the closer-but-inexact Team C line, and the first
+    # exact line wins over a later one on another side.
+    assert match is outcomes[3]
+
+
+def test_find_best_comparison_outcome_opposite_flex_breaks_ties_by_earliest_outcome():
+    outcomes = [
+        {"name": "Team A", "price": -110, "point": 3.5},
+        {"name": "Team B", "price": -105, "point": 4.0},
+        {"name": "Team C", "price": -110, "point": 3.0},
+        {"name": "Team B", "price": -115, "point": 3.0},
+    ]
+    columns = outcome_columns(outcomes)
+
+    match = find_best_comparison_outcome(
+        outcomes=outcomes,
+        name="Team A",
+        point=3.5,
+        allow_half_point_flex=True,
+        opposite=True,
+        columns=columns,
+    )
+
+    assert match is outcomes[1]
@@ -1,7 +1,14 @@
 """Formatting utilities for odds tracking application."""
 
+import sys
+from datetime import datetime
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
+EASTERN_TZ = ZoneInfo("America/New_York")
+# Python 3.11+ parses a trailing "Z" natively; older versions need "+00:00".
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
 BOOK_LABELS = {
     "draftkings": "DraftKings",
     "fanduel": "FanDuel",
@@ -15,31 +22,37 @@ def pretty_book_label(book_key: str) -> str:
     return BOOK_LABELS.get(book_key, book_key)
 
 
+@lru_cache(maxsize=4096)
+def parse_iso_datetime(value: str) -> datetime:
+    """Parse an Odds API ISO-8601 timestamp such as ``2024-01-01T00:00:00Z``.
+
+    Raises ``ValueError`` for malformed input, like ``datetime.fromisoformat``.
+    Results are memoized: every outcome and market of an event carries the same
+    ``commence_time`` string, and the returned datetimes are immutable.
+    """
+    if _FROMISOFORMAT_ACCEPTS_Z:
+        return datetime.fromisoformat(value)
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+@lru_cache(maxsize=4096)
 def format_start_time_est(iso_str: str) -> str:
     """Convert an ISO UTC time string into an easy-to-read EST label.
 
     Example output: "Thu, Nov 20, 3:30 PM ET".
     If parsing fails, returns the original string or a fallback message.
+    The label depends only on ``iso_str``, so results are memoized.
     """
     if not iso_str:
         return "—"
     
     try:
-        from datetime import datetime
         # Handle both ISO format with Z and +00:00
-        cleaned_str = iso_str.strip().replace("Z", "+00:00")
+        cleaned_str = iso_str.strip()
         if not cleaned_str:
             return "—"
         
-        dt_utc = datetime.fromisoformat(cleaned_str)
-        dt_et = dt_utc.astimezone(ZoneInfo("America/New_York"))
-        formatted = dt_et.strftime("%a, %b %d, %I:%M %p ET")
-        
-        # Handle leading zero in day (e.g., " 01" -> " 1")
-        if formatted[8:10] == " 0" and formatted[10].isdigit():
-            formatted = formatted[:8] + " " + formatted[10:]
-        
-        return formatted
+        return format_datetime_est(parse_iso_datetime(cleaned_str))
     except Exception:
         # Return original string if it looks like ISO format, otherwise return dash
         if iso_str and (iso_str.startswith("20") or "T" in iso_str):
@@ -47,9 +60,13 @@ def format_start_time_est(iso_str: str) -> str:
         return "—"
 
 
+def format_datetime_est(dt_utc: datetime) -> str:
+    """Format an aware datetime as the EST label used by ``format_start_time_est``."""
+    dt_et = dt_utc.astimezone(EASTERN_TZ)
+    formatted = dt_et.strftime("%a, %b %d, %I:%M %p ET")
 
+    # Handle leading zero in day (e.g., " 01" -> " 1")
+    if formatted[8:10] == " 0" and formatted[10].isdigit():
+        formatted = formatted[:8] + " " + formatted[10:]
 
-
-
-
-
+    return formatted
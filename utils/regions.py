@@ -1,6 +1,16 @@
 """Region computation utilities for The Odds API."""
 
-from typing import List, Set
+from functools import lru_cache
+from typing import Dict, FrozenSet, List
+
+# Odds API region for each supported bookmaker; unknown books default to "us".
+BOOK_REGIONS: Dict[str, str] = {
+    "draftkings": "us",
+    "fanduel": "us",
+    "fliff": "us2",
+    "novig": "us_ex",
+}
+DEFAULT_REGION = "us"
 
 
 def compute_regions_for_books(bookmaker_keys: List[str]) -> str:
@@ -11,23 +21,12 @@ def compute_regions_for_books(bookmaker_keys: List[str]) -> str:
     - Fliff lives in "us2"
     - Novig lives in "us_ex"
     """
-    regions: Set[str] = set()
-    for bk in bookmaker_keys:
-        if bk in ("draftkings", "fanduel"):
-            regions.add("us")
-        elif bk == "fliff":
-            regions.add("us2")
-        elif bk == "novig":
-            regions.add("us_ex")
-        else:
-            regions.add("us")
-
-    return ",".join(sorted(regions))
-
-
-
-
-
-
+    return _compute_regions(frozenset(bookmaker_keys))
 
 
+@lru_cache(maxsize=64)
+def _compute_regions(bookmaker_keys: FrozenSet[str]) -> str:
+    # Callers pass a handful of recurring book combinations, so the joined
+    # region string is memoized per distinct set of books.
+    regions = {BOOK_REGIONS.get(bk, DEFAULT_REGION) for bk in bookmaker_keys}
+    return ",".join(sorted(regions))